@@ -2,20 +2,27 @@
 LLM Query Handler
 Uses Ollama for natural language processing
 """
-import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import ollama
+import orjson
 
 from src.modules.conversational_interface.models import QueryResponse, QueryIntent
 from src.modules.insight_generation.models import InsightCollection
 from src.utils.logger import app_logger as logger
 from src.config.settings import settings
 
+# Queries per batched classification prompt (larger batches lose accuracy)
+INTENT_BATCH_SIZE = 16
+
 class LLMQueryHandler:
     """Handle queries using local LLM via Ollama"""
     
     def __init__(self, model_name: str = None):
         self.model_name = model_name or settings.LLM_MODEL
+        
+        # One client per handler: its httpx connection pool keeps the Ollama
+        # connection alive across turns instead of reconnecting per request
+        self.client = ollama.Client(host=settings.LLM_BASE_URL, timeout=settings.LLM_TIMEOUT)
         self.available = self._check_ollama_available()
         
         if self.available:
@@ -27,7 +34,7 @@ class LLMQueryHandler:
         """Check if Ollama is running and model is available"""
         try:
             # Try to list models
-            response = ollama.list()
+            response = self.client.list()
             
             # Check if our model is available
             available_models = [model['name'] for model in response.get('models', [])]
@@ -54,21 +61,44 @@ class LLMQueryHandler:
             logger.warning(f"Ollama check failed: {str(e)}")
             return False
     
+    def warmup(self) -> bool:
+        """Load the model into memory ahead of the first query and keep it resident"""
+        if not self.available:
+            return False
+        
+        try:
+            # An empty prompt only loads the model; keep_alive holds it between calls
+            self.client.generate(
+                model=self.model_name,
+                prompt="",
+                keep_alive=settings.LLM_KEEP_ALIVE,
+                options={'num_predict': 1}
+            )
+            logger.info(f"Warmed up model {self.model_name} (keep_alive={settings.LLM_KEEP_ALIVE})")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"Model warmup failed: {str(e)}")
+            return False
+    
     def process_query_with_llm(
         self,
         query: str,
         insights_collection: Optional[InsightCollection] = None,
-        conversation_history: list = None
+        conversation_history: list = None,
+        insights_context: Optional[str] = None
     ) -> QueryResponse:
-        """Process query using LLM"""
+        """Process query using LLM (insights_context: prebuilt _build_context output)"""
         
         if not self.available:
             logger.warning("LLM not available, cannot process query")
             return None
         
         try:
-            # Build context from insights
-            context = self._build_context(insights_collection)
+            # Build context from insights (reused when the caller already built it)
+            context = insights_context
+            if context is None:
+                context = self._build_context(insights_collection)
             
             # Build conversation history
             history_text = self._build_history(conversation_history)
@@ -77,9 +107,10 @@ class LLMQueryHandler:
             prompt = self._create_prompt(query, context, history_text)
             
             # Call LLM
-            response = ollama.generate(
+            response = self.client.generate(
                 model=self.model_name,
                 prompt=prompt,
+                keep_alive=settings.LLM_KEEP_ALIVE,
                 options={
                     'temperature': settings.LLM_TEMPERATURE,
                     'num_predict': settings.LLM_MAX_TOKENS
@@ -115,6 +146,60 @@ class LLMQueryHandler:
             logger.error(f"Error processing query with LLM: {str(e)}")
             return None
     
+    def classify_intents_batch(self, queries: List[str]) -> Optional[List[QueryIntent]]:
+        """Classify many queries with one LLM call per INTENT_BATCH_SIZE queries"""
+        
+        if not self.available:
+            return None
+        
+        intent_names = ", ".join(intent.value for intent in QueryIntent)
+        intents: List[QueryIntent] = []
+        
+        try:
+            for start in range(0, len(queries), INTENT_BATCH_SIZE):
+                batch = queries[start:start + INTENT_BATCH_SIZE]
+                numbered = "\n".join(f"{i}. {query}" for i, query in enumerate(batch, 1))
+                
+                # One shared instruction block for the whole batch
+                prompt = (
+                    f"Classify the intent of each numbered user query as one of: {intent_names}.\n"
+                    f'Respond with JSON: {{"intents": [one intent per query, in order]}}\n\n'
+                    f"{numbered}"
+                )
+                
+                response = self.client.generate(
+                    model=self.model_name,
+                    prompt=prompt,
+                    format='json',
+                    keep_alive=settings.LLM_KEEP_ALIVE,
+                    options={'temperature': 0.0}
+                )
+                
+                labels = orjson.loads(response['response']).get('intents', [])
+                if len(labels) != len(batch):
+                    logger.warning(f"LLM returned {len(labels)} intents for {len(batch)} queries")
+                    return None
+                
+                intents.extend(self._parse_intent(str(label)) for label in labels)
+            
+            logger.info(f"LLM classified {len(queries)} queries in batch")
+            return intents
+            
+        except Exception as e:
+            logger.error(f"Error classifying intents with LLM: {str(e)}")
+            return None
+    
+    def _parse_intent(self, label: str) -> QueryIntent:
+        """Map an LLM intent label to a QueryIntent"""
+        try:
+            return QueryIntent(label.strip().lower().replace(" ", "_").replace("-", "_"))
+        except ValueError:
+            return QueryIntent.GENERAL
+    
+    def build_insights_context(self, insights_collection: Optional[InsightCollection]) -> str:
+        """Prompt context for a collection, to reuse across several queries"""
+        return self._build_context(insights_collection)
+    
     def _build_context(self, insights_collection: Optional[InsightCollection]) -> str:
         """Build context from insights"""
         
@@ -267,9 +352,10 @@ Your response:"""
             if context:
                 prompt = f"Context: {context}\n\nQuestion: {message}"
             
-            response = ollama.generate(
+            response = self.client.generate(
                 model=self.model_name,
                 prompt=prompt,
+                keep_alive=settings.LLM_KEEP_ALIVE,
                 options={'temperature': temperature}
             )
             
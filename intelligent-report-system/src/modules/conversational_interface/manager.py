@@ -4,16 +4,23 @@ Manages conversation state and context with hybrid LLM + pattern matching
 """
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List, Iterator, Tuple
 
 from src.modules.conversational_interface.models import (
-    ConversationContext, ConversationTurn, QueryResponse
+    ConversationContext, ConversationTurn, QueryResponse, IntentClassification
 )
 from src.modules.conversational_interface.query_processor import QueryProcessor
 from src.modules.conversational_interface.llm_handler import LLMQueryHandler
 from src.modules.insight_generation.models import InsightCollection
 from src.utils.logger import app_logger as logger
 
+# Turns of history passed to the LLM (matches LLMQueryHandler._build_history)
+HISTORY_TURNS_FOR_LLM = 3
+
+# Confidence assigned when the LLM overrides a pattern-matched intent; the model
+# returns no score, so this mirrors the fixed confidence of LLM responses
+LLM_INTENT_CONFIDENCE = 0.85
+
 class ConversationManager:
     """Manage conversational interactions with hybrid LLM + pattern matching"""
     
@@ -61,15 +68,58 @@ class ConversationManager:
             session_id = self.create_session()
             context = self.active_sessions[session_id]
         
+        return self._process_turn(session_id, context, user_message, insights_collection)
+    
+    def process_messages_stream(
+        self,
+        session_id: str,
+        user_messages: List[str],
+        insights_collection: Optional[InsightCollection] = None
+    ) -> Iterator[Tuple[str, QueryResponse]]:
+        """Process a sequence of messages in one session, yielding each response as it completes"""
+        
+        # Resolve the session and build the insight prompt context once for all turns
+        context = self.active_sessions.get(session_id)
+        if not context:
+            session_id = self.create_session()
+            context = self.active_sessions[session_id]
+        
+        insights_context = None
+        if self.use_llm and self.llm_handler and self.llm_handler.available:
+            try:
+                insights_context = self.llm_handler.build_insights_context(insights_collection)
+            except Exception as e:
+                logger.warning(f"Could not prebuild insight context, building per turn: {str(e)}")
+        
+        # Turns stay sequential: each prompt includes the previous turns
+        for user_message in user_messages:
+            yield user_message, self._process_turn(
+                session_id, context, user_message, insights_collection, insights_context
+            )
+    
+    def _process_turn(
+        self,
+        session_id: str,
+        context: ConversationContext,
+        user_message: str,
+        insights_collection: Optional[InsightCollection] = None,
+        insights_context: Optional[str] = None
+    ) -> QueryResponse:
+        """Answer one message and record it in the session"""
+        
         # Try LLM first if available
         response = None
         if self.use_llm and self.llm_handler:
             try:
-                history = self.get_conversation_history(session_id)
+                # The LLM prompt only uses the latest few turns
+                history = self.get_conversation_history(
+                    session_id, limit=HISTORY_TURNS_FOR_LLM, most_recent=True
+                )
                 response = self.llm_handler.process_query_with_llm(
                     user_message,
                     insights_collection,
-                    history
+                    history,
+                    insights_context
                 )
                 if response:
                     logger.info("Used LLM for query processing")
@@ -102,15 +152,46 @@ class ConversationManager:
         
         return response
     
-    def get_conversation_history(self, session_id: str) -> list:
-        """Get conversation history"""
+    def classify_intents(self, queries: List[str]) -> List[IntentClassification]:
+        """Classify several queries, using one batched LLM call when available"""
+        
+        # Pattern matching always supplies entities/keywords and the fallback intent
+        classifications = [self.query_processor.classify_intent(query) for query in queries]
+        
+        if self.use_llm and self.llm_handler and queries:
+            intents = self.llm_handler.classify_intents_batch(queries)
+            if intents:
+                # Classifications are frozen (shared with the cache), so overrides are copies
+                classifications = [
+                    classification.model_copy(
+                        update={'intent': intent, 'confidence': LLM_INTENT_CONFIDENCE}
+                    ) if intent != classification.intent else classification
+                    for classification, intent in zip(classifications, intents)
+                ]
+                logger.info("Used LLM for batch intent classification")
+        
+        return classifications
+    
+    def get_conversation_history(
+        self,
+        session_id: str,
+        limit: Optional[int] = None,
+        most_recent: bool = False
+    ) -> list:
+        """Get conversation history (optionally only the first/last ``limit`` turns)"""
         
         context = self.active_sessions.get(session_id)
         if not context:
             return []
         
+        # Slice before converting so only the requested turns are built
+        turns = context.turns
+        if limit is not None:
+            start = max(len(turns) - limit, 0) if most_recent else 0
+            turns = turns[start:start + limit]  # O(limit) list slice
+        
         history = []
-        for turn in context.turns:
+        for turn in turns:
             history.append({
                 "user": turn.user_query,
                 "assistant": turn.assistant_response,
@@ -120,6 +201,11 @@ class ConversationManager:
         
         return history
     
+    def get_turn_count(self, session_id: str) -> int:
+        """Number of turns in a session"""
+        context = self.active_sessions.get(session_id)
+        return len(context.turns) if context else 0
+    
     def clear_session(self, session_id: str):
         """Clear a conversation session"""
         if session_id in self.active_sessions:
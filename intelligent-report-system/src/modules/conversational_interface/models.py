@@ -2,8 +2,8 @@
 Conversational Interface Models
 Defines conversation structures and query types
 """
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -76,8 +76,10 @@ class QueryResponse(BaseModel):
     sources: List[str] = []
 
 class IntentClassification(BaseModel):
-    """Result of intent classification"""
+    """Result of intent classification (immutable, so cached results can be shared)"""
+    model_config = ConfigDict(frozen=True)
+    
     intent: QueryIntent
     confidence: float = Field(ge=0.0, le=1.0)
-    entities: List[str] = []
-    keywords: List[str] = []
\ No newline at end of file
+    entities: Tuple[str, ...] = ()
+    keywords: Tuple[str, ...] = ()
\ No newline at end of file
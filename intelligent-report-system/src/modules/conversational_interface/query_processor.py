@@ -4,6 +4,7 @@ Processes natural language queries without requiring LLM
 Uses pattern matching and keyword extraction
 """
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 import uuid
 
@@ -13,13 +14,36 @@ from src.modules.conversational_interface.models import (
 from src.modules.insight_generation.models import InsightCollection
 from src.utils.logger import app_logger as logger
 
+# Entity patterns, compiled once at import
+NUMBER_PATTERN = re.compile(r'\b\d+\.?\d*%?\b')
+TIME_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'\b\d{4}\b',  # Year
+        r'\b(Q[1-4])\b',  # Quarter
+        r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\b',
+        r'\b(last|this|next) (week|month|quarter|year)\b'
+    )
+]
+
 class QueryProcessor:
     """Process natural language queries using pattern matching"""
     
     def __init__(self):
         self.intent_patterns = self._build_intent_patterns()
+        self._compiled_patterns = self._compile_patterns(self.intent_patterns)
+        
+        # Per-instance LRU of classifications keyed on the raw query text
+        self._classify_cached = lru_cache(maxsize=128)(self._classify_uncached)
         logger.info("QueryProcessor initialized")
     
+    def reload_patterns(self):
+        """Rebuild intent patterns and drop cached classifications"""
+        self.intent_patterns = self._build_intent_patterns()
+        self._compiled_patterns = self._compile_patterns(self.intent_patterns)
+        self._classify_cached.cache_clear()
+        logger.info("QueryProcessor intent patterns reloaded")
+    
     def _build_intent_patterns(self) -> Dict[QueryIntent, List[str]]:
         """Build keyword patterns for intent classification"""
         return {
@@ -57,19 +81,28 @@ class QueryProcessor:
             ]
         }
     
+    def _compile_patterns(
+        self, intent_patterns: Dict[QueryIntent, List[str]]
+    ) -> Dict[QueryIntent, List[re.Pattern]]:
+        """Compile intent patterns once instead of on every query"""
+        return {
+            intent: [re.compile(pattern) for pattern in patterns]
+            for intent, patterns in intent_patterns.items()
+        }
+    
     def classify_intent(self, query: str) -> IntentClassification:
+        """Classify user query intent (cached; the result is frozen and shared)"""
+        return self._classify_cached(query)
+    
+    def _classify_uncached(self, query: str) -> IntentClassification:
         """Classify user query intent"""
         
         query_lower = query.lower()
         intent_scores = {}
         
         # Score each intent
-        for intent, patterns in self.intent_patterns.items():
-            score = 0
-            for pattern in patterns:
-                if re.search(pattern, query_lower):
-                    score += 1
-            intent_scores[intent] = score
+        for intent, patterns in self._compiled_patterns.items():
+            intent_scores[intent] = sum(1 for pattern in patterns if pattern.search(query_lower))
         
         # Get best match
         if max(intent_scores.values()) > 0:
@@ -100,18 +133,12 @@ class QueryProcessor:
         entities = []
         
         # Extract numbers
-        numbers = re.findall(r'\b\d+\.?\d*%?\b', query)
+        numbers = NUMBER_PATTERN.findall(query)
         entities.extend(numbers)
         
         # Extract dates/time periods
-        time_patterns = [
-            r'\b\d{4}\b',  # Year
-            r'\b(Q[1-4])\b',  # Quarter
-            r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\b',
-            r'\b(last|this|next) (week|month|quarter|year)\b'
-        ]
-        for pattern in time_patterns:
-            matches = re.findall(pattern, query, re.IGNORECASE)
+        for pattern in TIME_PATTERNS:
+            matches = pattern.findall(query)
             entities.extend([m if isinstance(m, str) else m[0] for m in matches])
         
         return entities
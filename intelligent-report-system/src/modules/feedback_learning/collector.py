@@ -3,8 +3,12 @@ Feedback Collector
 Collects and stores user feedback
 """
 import uuid
-from typing import List, Optional, Dict
+from array import array
+from collections import defaultdict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
 
 from src.modules.feedback_learning.models import (
     InsightFeedback, ReportFeedback, ImplicitFeedback,
@@ -12,6 +16,23 @@ from src.modules.feedback_learning.models import (
 )
 from src.utils.logger import app_logger as logger
 
+# Implicit feedback interaction flags
+CLICKED, DRILLED_DOWN, SHARED = 1, 2, 4
+VIEW_DS_MAX = 0xFFFF
+
+def _summarize_ratings(ratings: np.ndarray) -> Tuple[float, float, float]:
+    """Mean, positive (>= 4) and negative (<= 2) rate over rated entries"""
+    rated = ratings[ratings > 0]
+    
+    if rated.size == 0:
+        return 0.0, 0.0, 0.0
+    
+    return (
+        float(rated.mean()),
+        float(np.count_nonzero(rated >= 4) / rated.size),
+        float(np.count_nonzero(rated <= 2) / rated.size)
+    )
+
 class FeedbackCollector:
     """Collect and manage user feedback"""
     
@@ -19,8 +40,107 @@ class FeedbackCollector:
         self.insight_feedback: Dict[str, List[InsightFeedback]] = {}
         self.report_feedback: List[ReportFeedback] = []
         self.implicit_feedback: List[ImplicitFeedback] = []
+        
+        # Struct-of-arrays copy of insight feedback for vectorized aggregation.
+        # Columns are grown by doubling; only the first _size rows are valid.
+        self.insight_ids: List[str] = []
+        self.role_ids: List[str] = []
+        self._insight_index: Dict[str, int] = {}
+        self._role_index: Dict[str, int] = {}
+        self._size = 0
+        self._columns: Dict[str, np.ndarray] = {
+            'insight_idx': np.empty(64, dtype=np.int32),
+            'role_idx': np.empty(64, dtype=np.int32),   # -1 = no role
+            'rating': np.empty(64, dtype=np.int8),      # 0 = no rating
+            'relevant': np.empty(64, dtype=np.int8),    # -1 = not given
+            'accurate': np.empty(64, dtype=np.int8),    # -1 = not given
+            'timestamp': np.empty(64, dtype='datetime64[us]'),
+        }
+        
+        # Compact per-insight buffers of rated row numbers (4 bytes each) so a
+        # single insight's ratings are gathered in O(k) without copying them
+        self._rated_rows: Dict[str, array] = defaultdict(lambda: array('i'))
+        
+        # Compact columnar copy of implicit feedback for engagement scoring: view time
+        # as uint16 deciseconds (0-6553.5s), interned insight index and a
+        # clicked/drilled_down/shared bitmask (~7 bytes per event). The original
+        # ImplicitFeedback records stay in implicit_feedback unchanged.
+        # Insights are interned separately so implicit-only ones don't enter the rating columns.
+        self.implicit_insight_ids: List[str] = []
+        self._implicit_index: Dict[str, int] = {}
+        self._view_ds = array('H')
+        self._implicit_insight_idx = array('i')
+        self._implicit_flags = array('B')
         logger.info("FeedbackCollector initialized")
     
+    def _intern(self, value: str, index: Dict[str, int], values: List[str]) -> int:
+        """Map an id to a dense integer index"""
+        if value not in index:
+            index[value] = len(values)
+            values.append(value)
+        return index[value]
+    
+    def _append_columns(self, feedbacks: List[InsightFeedback]):
+        """Append insight feedback to the columnar store, doubling capacity when full"""
+        count = len(feedbacks)
+        needed = self._size + count
+        capacity = len(self._columns['rating'])
+        
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            for name, column in self._columns.items():
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:self._size] = column[:self._size]
+                self._columns[name] = grown
+        
+        rows = slice(self._size, needed)
+        self._columns['insight_idx'][rows] = np.fromiter(
+            (self._intern(f.insight_id, self._insight_index, self.insight_ids) for f in feedbacks),
+            dtype=np.int32, count=count
+        )
+        self._columns['role_idx'][rows] = np.fromiter(
+            (self._intern(f.role_id, self._role_index, self.role_ids) if f.role_id else -1 for f in feedbacks),
+            dtype=np.int32, count=count
+        )
+        self._columns['rating'][rows] = np.fromiter(
+            (f.rating or 0 for f in feedbacks), dtype=np.int8, count=count
+        )
+        self._columns['relevant'][rows] = np.fromiter(
+            (-1 if f.is_relevant is None else int(f.is_relevant) for f in feedbacks),
+            dtype=np.int8, count=count
+        )
+        self._columns['accurate'][rows] = np.fromiter(
+            (-1 if f.is_accurate is None else int(f.is_accurate) for f in feedbacks),
+            dtype=np.int8, count=count
+        )
+        self._columns['timestamp'][rows] = np.array(
+            [f.timestamp for f in feedbacks], dtype='datetime64[us]'
+        )
+        for row, feedback in enumerate(feedbacks, self._size):
+            if feedback.rating:
+                self._rated_rows[feedback.insight_id].append(row)
+        
+        self._size = needed
+    
+    def get_feedback_arrays(self) -> Dict[str, np.ndarray]:
+        """Columnar views of all insight feedback (indices refer to insight_ids / role_ids)"""
+        return {name: column[:self._size] for name, column in self._columns.items()}
+    
+    def get_rating_stats(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-insight rating sums (float64) and counts (indexed like insight_ids)"""
+        arrays = self.get_feedback_arrays()
+        rated = arrays['rating'] > 0
+        insight_idx = arrays['insight_idx'][rated]
+        n_insights = len(self.insight_ids)
+        
+        counts = np.bincount(insight_idx, minlength=n_insights)
+        # bincount returns int64 when there is nothing to weight; keep sums float
+        sums = np.bincount(
+            insight_idx, weights=arrays['rating'][rated], minlength=n_insights
+        ).astype(np.float64, copy=False)
+        return sums, counts
+    
     def record_insight_feedback(
         self,
         insight_id: str,
@@ -49,10 +169,38 @@ class FeedbackCollector:
         if insight_id not in self.insight_feedback:
             self.insight_feedback[insight_id] = []
         self.insight_feedback[insight_id].append(feedback)
+        self._append_columns([feedback])
         
         logger.info(f"Recorded feedback for insight {insight_id}: rating={rating}")
         return feedback
     
+    def record_insight_feedback_batch(self, records: List[Dict]) -> List[InsightFeedback]:
+        """Record many insight feedbacks at once (dicts with record_insight_feedback's arguments)"""
+        
+        feedbacks = [
+            InsightFeedback(
+                feedback_id=f"fb_{uuid.uuid4().hex[:8]}",
+                insight_id=record['insight_id'],
+                user_id=record.get('user_id'),
+                role_id=record.get('role_id'),
+                feedback_type=FeedbackType.RATING,
+                rating=record.get('rating'),
+                is_relevant=record.get('is_relevant'),
+                is_accurate=record.get('is_accurate'),
+                comment=record.get('comment')
+            )
+            for record in records
+        ]
+        
+        # Store feedback
+        for feedback in feedbacks:
+            self.insight_feedback.setdefault(feedback.insight_id, []).append(feedback)
+        
+        self._append_columns(feedbacks)
+        
+        logger.info(f"Recorded {len(feedbacks)} insight feedbacks in batch")
+        return feedbacks
+    
     def record_report_feedback(
         self,
         report_id: str,
@@ -108,6 +256,15 @@ class FeedbackCollector:
         
         self.implicit_feedback.append(feedback)
         
+        # Quantize to deciseconds; longer views saturate at the uint16 limit
+        self._view_ds.append(min(max(round(time_spent_viewing * 10), 0), VIEW_DS_MAX))
+        self._implicit_insight_idx.append(
+            self._intern(insight_id, self._implicit_index, self.implicit_insight_ids)
+        )
+        self._implicit_flags.append(
+            (CLICKED if clicked else 0) | (DRILLED_DOWN if drilled_down else 0) | (SHARED if shared else 0)
+        )
+        
         logger.debug(f"Recorded implicit feedback for {insight_id}")
         return feedback
     
@@ -117,13 +274,13 @@ class FeedbackCollector:
     
     def get_average_rating(self, insight_id: str) -> Optional[float]:
         """Get average rating for an insight"""
-        feedback_list = self.get_insight_feedback(insight_id)
-        ratings = [f.rating for f in feedback_list if f.rating is not None]
+        rows = self._rated_rows.get(insight_id)
         
-        if not ratings:
+        if not rows:
             return None
         
-        return sum(ratings) / len(ratings)
+        # Gather only this insight's rows from the rating column (zero-copy index view)
+        return float(self._columns['rating'][np.frombuffer(rows, dtype=np.int32)].mean())
     
     def get_feedback_summary(
         self,
@@ -134,39 +291,36 @@ class FeedbackCollector:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
+        # Insight feedback comes straight from the columnar store (0 = no rating);
+        # report feedback is kept as records, so only its own list is walked
+        arrays = self.get_feedback_arrays()
+        report_ratings = np.fromiter(
+            (f.overall_rating for f in self.report_feedback),
+            dtype=np.int8,
+            count=len(self.report_feedback)
+        )
+        report_timestamps = np.array(
+            [f.timestamp for f in self.report_feedback], dtype='datetime64[us]'
+        )
+        
         # Filter recent feedback
-        recent_insight_feedback = []
-        for feedback_list in self.insight_feedback.values():
-            recent_insight_feedback.extend([
-                f for f in feedback_list
-                if f.timestamp >= start_date
-            ])
-        
-        recent_report_feedback = [
-            f for f in self.report_feedback
-            if f.timestamp >= start_date
-        ]
+        cutoff = np.datetime64(start_date, 'us')
+        recent_insight = arrays['timestamp'] >= cutoff
+        recent_report = report_timestamps >= cutoff
+        total_feedback = int(np.count_nonzero(recent_insight) + np.count_nonzero(recent_report))
         
-        # Calculate aggregates
-        total_feedback = len(recent_insight_feedback) + len(recent_report_feedback)
-        
-        if total_feedback == 0:
-            avg_rating = 0.0
-            positive_rate = 0.0
-            negative_rate = 0.0
-        else:
-            # Average rating from insights
-            insight_ratings = [f.rating for f in recent_insight_feedback if f.rating]
-            report_ratings = [f.overall_rating for f in recent_report_feedback]
-            all_ratings = insight_ratings + report_ratings
-            
-            avg_rating = sum(all_ratings) / len(all_ratings) if all_ratings else 0.0
-            positive_rate = sum(1 for r in all_ratings if r >= 4) / len(all_ratings) if all_ratings else 0.0
-            negative_rate = sum(1 for r in all_ratings if r <= 2) / len(all_ratings) if all_ratings else 0.0
+        # Calculate aggregates in one vectorized pass
+        avg_rating, positive_rate, negative_rate = _summarize_ratings(np.concatenate([
+            arrays['rating'][recent_insight],
+            report_ratings[recent_report]
+        ]))
         
         # Collect common themes
-        comments = [f.comment for f in recent_insight_feedback if f.comment]
-        improvements = [f.what_needs_improvement for f in recent_report_feedback if f.what_needs_improvement]
+        improvements = [
+            f.what_needs_improvement
+            for f, is_recent in zip(self.report_feedback, recent_report)
+            if is_recent and f.what_needs_improvement
+        ]
         
         summary = FeedbackSummary(
             summary_id=f"summary_{uuid.uuid4().hex[:8]}",
@@ -184,49 +338,66 @@ class FeedbackCollector:
         logger.info(f"Generated feedback summary: {total_feedback} feedbacks, avg={avg_rating:.2f}")
         return summary
     
+    def get_rating_timeseries(self, days: int = 30) -> pd.DataFrame:
+        """Get average rating per day for recent period"""
+        
+        start_date = datetime.now() - timedelta(days=days)
+        
+        # Collect (timestamp, rating) pairs from insight and report feedback
+        records = [
+            (f.timestamp, f.rating)
+            for feedback_list in self.insight_feedback.values()
+            for f in feedback_list
+            if f.rating and f.timestamp >= start_date
+        ]
+        records.extend(
+            (f.timestamp, f.overall_rating)
+            for f in self.report_feedback
+            if f.timestamp >= start_date
+        )
+        
+        if not records:
+            return pd.DataFrame(columns=['avg_rating'], dtype=float)
+        
+        # Bucket by day in a single vectorized pass
+        df = pd.DataFrame(records, columns=['ts', 'rating'])
+        timeseries = df.set_index('ts').resample('D')['rating'].mean()
+        
+        return timeseries.to_frame(name='avg_rating')
+    
     def get_low_rated_insights(self, threshold: float = 3.0) -> List[str]:
         """Get insights with low ratings"""
-        low_rated = []
+        sums, counts = self.get_rating_stats()
         
-        for insight_id, feedback_list in self.insight_feedback.items():
-            avg_rating = self.get_average_rating(insight_id)
-            if avg_rating and avg_rating < threshold:
-                low_rated.append(insight_id)
+        # One pass over all insights instead of one scan per insight
+        rated = counts > 0
+        averages = np.divide(sums, counts, out=np.zeros(len(sums), dtype=np.float64), where=rated)
+        low = np.flatnonzero(rated & (averages < threshold))
         
-        return low_rated
+        return [self.insight_ids[i] for i in low]
     
     def get_high_engagement_insights(self) -> List[str]:
         """Get insights with high user engagement"""
-        engagement_scores = {}
-        
-        for feedback in self.implicit_feedback:
-            insight_id = feedback.insight_id
-            
-            # Calculate engagement score
-            score = 0
-            score += feedback.time_spent_viewing / 10  # 10 seconds = 1 point
-            if feedback.clicked:
-                score += 2
-            if feedback.drilled_down:
-                score += 3
-            if feedback.shared:
-                score += 5
-            
-            if insight_id not in engagement_scores:
-                engagement_scores[insight_id] = []
-            engagement_scores[insight_id].append(score)
-        
-        # Average scores
-        avg_scores = {
-            iid: sum(scores) / len(scores)
-            for iid, scores in engagement_scores.items()
-        }
+        if not self._view_ds:
+            return []
         
-        # Sort by score
-        sorted_insights = sorted(
-            avg_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
+        view_ds = np.frombuffer(self._view_ds, dtype=np.uint16)
+        insight_idx = np.frombuffer(self._implicit_insight_idx, dtype=np.int32)
+        flags = np.frombuffer(self._implicit_flags, dtype=np.uint8)
+        
+        # Engagement score: 10 seconds = 1 point, plus interaction bonuses
+        scores = (
+            view_ds / 100.0
+            + 2 * ((flags & CLICKED) > 0)
+            + 3 * ((flags & DRILLED_DOWN) > 0)
+            + 5 * ((flags & SHARED) > 0)
         )
         
-        return [iid for iid, score in sorted_insights[:10]]
\ No newline at end of file
+        # Average per insight (indices are interned in first-seen order, and every
+        # interned insight has at least one row)
+        averages = np.bincount(insight_idx, weights=scores) / np.bincount(insight_idx)
+        
+        # Sort by score (stable, so ties keep first-seen order)
+        ranked = np.argsort(-averages, kind='stable')[:10]
+        
+        return [self.implicit_insight_ids[i] for i in ranked.tolist()]
\ No newline at end of file
@@ -87,31 +87,41 @@ class ImageDataProcessor:
     def _extract_text_ocr(self, image: Image.Image) -> tuple[str, Optional[float]]:
         """Extract text from image using OCR"""
         try:
-            # Convert PIL image to numpy array
+            # Convert PIL image to numpy array (palette/other modes go through RGB)
+            if image.mode not in ('L', 'RGB', 'RGBA'):
+                image = image.convert('RGB')
             img_array = np.array(image)
             
             # Preprocess image for better OCR
             processed_img = self._preprocess_image(img_array)
             
-            # Perform OCR with detailed output
+            # Single Tesseract pass: words, layout and confidences together
             ocr_data = pytesseract.image_to_data(
                 processed_img,
                 lang=settings.OCR_LANGUAGE,
+                config=settings.OCR_TESSERACT_CONFIG,
                 output_type=pytesseract.Output.DICT
             )
             
-            # Extract text and calculate average confidence
-            texts = []
+            # Extract text (grouped into lines) and calculate average confidence
+            lines = {}
             confidences = []
             
             for i, conf in enumerate(ocr_data['conf']):
+                conf = float(conf)  # older pytesseract versions return strings
                 if conf > 0:  # Valid detection
                     text = ocr_data['text'][i].strip()
                     if text:
-                        texts.append(text)
+                        line_key = (
+                            ocr_data['block_num'][i],
+                            ocr_data['par_num'][i],
+                            ocr_data['line_num'][i]
+                        )
+                        lines.setdefault(line_key, []).append(text)
                         confidences.append(conf)
             
-            extracted_text = " ".join(texts)
+            texts = [" ".join(words) for words in lines.values()]
+            extracted_text = "\n".join(texts)
             avg_confidence = np.mean(confidences) if confidences else 0.0
             
             logger.debug(f"OCR extracted {len(texts)} text blocks with avg confidence {avg_confidence:.2f}")
@@ -125,15 +135,30 @@ class ImageDataProcessor:
     def _preprocess_image(self, image: np.ndarray) -> np.ndarray:
         """Preprocess image for better OCR results"""
         try:
-            # Convert to grayscale if color
+            # Convert to grayscale if color (PIL arrays are RGB/RGBA)
             if len(image.shape) == 3:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+                code = cv2.COLOR_RGBA2GRAY if image.shape[2] == 4 else cv2.COLOR_RGB2GRAY
+                gray = cv2.cvtColor(image, code)
             else:
                 gray = image
             
+            # Downscale oversized scans; Tesseract time grows with pixel count
+            height, width = gray.shape[:2]
+            scale = settings.OCR_MAX_DIMENSION / max(height, width)
+            if scale < 1:
+                gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            
+            # Equalize local contrast
+            if settings.OCR_USE_CLAHE:
+                clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+                gray = clahe.apply(gray)
+            
             # Apply thresholding
             _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
             
+            # Straighten skewed scans
+            thresh = self._deskew(thresh)
+            
             # Denoise
             denoised = cv2.fastNlMeansDenoising(thresh)
             
@@ -143,6 +168,36 @@ class ImageDataProcessor:
             logger.error(f"Error preprocessing image: {str(e)}")
             return image
     
+    def _deskew(self, binary: np.ndarray) -> np.ndarray:
+        """Rotate a binarized page so text lines are horizontal"""
+        # Text is dark on light after thresholding, so invert to select ink pixels
+        coords = cv2.findNonZero(cv2.bitwise_not(binary))
+        if coords is None:
+            return binary
+        
+        # minAreaRect reports angles in (0, 90] on OpenCV >= 4.5 and [-90, 0) before
+        angle = cv2.minAreaRect(coords)[-1]
+        if angle > 45:
+            angle -= 90
+        elif angle < -45:
+            angle += 90
+        
+        # Ignore negligible skew and implausible estimates (e.g. sparse pages)
+        if abs(angle) < 0.5 or abs(angle) > 15:
+            return binary
+        
+        height, width = binary.shape[:2]
+        matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+        
+        logger.debug(f"Deskewing image by {angle:.2f} degrees")
+        return cv2.warpAffine(
+            binary,
+            matrix,
+            (width, height),
+            flags=cv2.INTER_CUBIC,
+            borderMode=cv2.BORDER_REPLICATE
+        )
+    
     def _detect_objects(self, file_path: str) -> list[str]:
         """
         Detect objects in image (simplified implementation)
@@ -2,7 +2,8 @@
 Data models for input processing module
 """
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional, Literal
+from typing import List, Dict, Any, Optional, Literal, NamedTuple, Iterator
+import numpy as np
 from datetime import datetime
 from enum import Enum
 
@@ -42,6 +43,55 @@ class Entity(BaseModel):
     end: int
     confidence: Optional[float] = None
 
+class EntityRecord(NamedTuple):
+    """Lightweight row view of one entity in an EntityArray"""
+    text: str
+    label: str
+    start: int
+    end: int
+
+class EntityArray:
+    """Column-oriented (struct-of-arrays) view of extracted entities"""
+    
+    def __init__(self, text: np.ndarray, label: np.ndarray, start: np.ndarray, end: np.ndarray):
+        self.text = text
+        self.label = label
+        self.start = start
+        self.end = end
+    
+    @classmethod
+    def from_entities(cls, entities: List[Entity]) -> "EntityArray":
+        """Build parallel arrays from a list of Entity models"""
+        return cls(
+            text=np.array([e.text for e in entities], dtype=object),
+            label=np.array([e.label for e in entities], dtype=object),
+            start=np.array([e.start for e in entities], dtype=np.int64),
+            end=np.array([e.end for e in entities], dtype=np.int64)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.text)
+    
+    def __iter__(self) -> Iterator[EntityRecord]:
+        for row in zip(self.text, self.label, self.start.tolist(), self.end.tolist()):
+            yield EntityRecord(*row)
+    
+    def _take(self, index: np.ndarray) -> "EntityArray":
+        return EntityArray(self.text[index], self.label[index], self.start[index], self.end[index])
+    
+    def filter_label(self, label: str) -> "EntityArray":
+        """Entities with the given label, selected by a vectorized mask"""
+        return self._take(self.label == label)
+    
+    def sort_by_label(self) -> "EntityArray":
+        """Entities grouped by label (stable, so text order is kept within a label)"""
+        return self._take(np.argsort(self.label, kind="stable"))
+    
+    def label_counts(self) -> Dict[str, int]:
+        """Number of entities per label"""
+        labels, counts = np.unique(self.label, return_counts=True)
+        return dict(zip(labels.tolist(), counts.tolist()))
+
 class Sentiment(BaseModel):
     """Sentiment analysis result"""
     label: str  # positive, negative, neutral
@@ -63,6 +113,11 @@ class TextMetadata(BaseModel):
     sentiment: Optional[Sentiment] = None
     topics: List[Topic] = []
     key_phrases: List[str] = []
+    
+    @property
+    def entity_array(self) -> EntityArray:
+        """Entities as parallel arrays for counting, filtering and grouping"""
+        return EntityArray.from_entities(self.entities)
 
 class ImageMetadata(BaseModel):
     """Metadata for processed images"""
@@ -3,17 +3,24 @@ Main Input Processing Coordinator
 Orchestrates all data processors
 """
 from pathlib import Path
-from typing import Union, List
+from typing import Union, List, Optional
 import uuid
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
+import pickle
 
 from src.modules.input_processing.structured_processor import StructuredDataProcessor
 from src.modules.input_processing.text_processor import TextDataProcessor
 from src.modules.input_processing.image_processor import ImageDataProcessor
 from src.modules.input_processing.models import (
-    ProcessedData, DataBatch, DataModality, ProcessingConfig
+    ProcessedData, DataBatch, DataModality, ProcessingConfig, ProcessingStatus
 )
 from src.utils.logger import app_logger as logger
+from src.config.settings import settings
+
+# Bump when processor output changes so stale cache entries are not reused
+PROCESSED_CACHE_VERSION = "1"
 
 class InputProcessor:
     """Main coordinator for all input processing"""
@@ -46,21 +53,31 @@ class InputProcessor:
                 raise FileNotFoundError(f"File not found: {file_path}")
             
             suffix = path.suffix.lower()
+            
+            # Reuse the result of an earlier run on identical content
+            cache_path = self._cache_path(path, kwargs)
+            cached = self._load_cached(cache_path, file_path)
+            if cached is not None:
+                return cached
+            
             logger.info(f"Processing file: {file_path} (type: {suffix})")
             
             # Route to appropriate processor
             if suffix in self.extension_map['structured']:
-                return self.structured_processor.process(file_path, **kwargs)
+                result = self.structured_processor.process(file_path, **kwargs)
             
             elif suffix in self.extension_map['text']:
-                return self.text_processor.process(file_path)
+                result = self.text_processor.process(file_path)
             
             elif suffix in self.extension_map['image']:
                 is_scanned = kwargs.get('is_scanned_doc', False)
-                return self.image_processor.process(file_path, is_scanned)
+                result = self.image_processor.process(file_path, is_scanned)
             
             else:
                 raise ValueError(f"Unsupported file type: {suffix}")
+            
+            self._store_cached(cache_path, result)
+            return result
         
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {str(e)}")
@@ -114,19 +131,55 @@ class InputProcessor:
             raise
     
     def process_batch(self, file_paths: List[str]) -> DataBatch:
-        """Process a batch of files"""
+        """Process a batch of files concurrently, preserving input order"""
         try:
             logger.info(f"Processing batch of {len(file_paths)} files")
             
-            processed_items = []
-            for file_path in file_paths:
-                try:
-                    result = self.process_file(file_path)
-                    processed_items.append(result)
-                except Exception as e:
-                    logger.error(f"Failed to process {file_path}: {str(e)}")
-                    continue
+            results: List[Optional[ProcessedData]] = [None] * len(file_paths)
+            
+            # Text files share one spaCy pipeline, so they run on the calling thread;
+            # structured reads and OCR (Tesseract runs out-of-process) go to a thread pool
+            text_indices = []
+            pooled_indices = []
+            for index, file_path in enumerate(file_paths):
+                if Path(file_path).suffix.lower() in self.extension_map['text']:
+                    text_indices.append(index)
+                else:
+                    pooled_indices.append(index)
             
+            with ThreadPoolExecutor(max_workers=settings.MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(self.process_file, file_paths[index]): index
+                    for index in pooled_indices
+                }
+                
+                # Text files go through one batched spaCy pass (cache hits skip it)
+                cache_paths = {}
+                pending_indices = []
+                for index in text_indices:
+                    file_path = file_paths[index]
+                    if not self._exists(file_path):
+                        continue
+                    cache_paths[index] = self._cache_path(Path(file_path), {})
+                    results[index] = self._load_cached(cache_paths[index], file_path)
+                    if results[index] is None:
+                        pending_indices.append(index)
+                
+                text_results = self.text_processor.process_files(
+                    [file_paths[index] for index in pending_indices]
+                )
+                for index, result in zip(pending_indices, text_results):
+                    results[index] = result
+                    self._store_cached(cache_paths[index], result)
+                
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to process {file_paths[index]}: {str(e)}")
+            
+            processed_items = [result for result in results if result is not None]
             batch = self._create_batch(processed_items)
             
             logger.info(f"Successfully processed {len(processed_items)} files in batch")
@@ -136,6 +189,61 @@ class InputProcessor:
             logger.error(f"Error processing batch: {str(e)}")
             raise
     
+    def _cache_path(self, path: Path, options: dict) -> Optional[Path]:
+        """Cache location for a file, keyed on a blake2b hash of its content and options"""
+        if not settings.CACHE_PROCESSED_FILES:
+            return None
+        
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{PROCESSED_CACHE_VERSION}|{path.suffix.lower()}|{sorted(options.items())}".encode())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                hasher.update(chunk)
+        
+        return settings.PROCESSED_CACHE_DIR / f"{hasher.hexdigest()}.pkl"
+    
+    def _load_cached(self, cache_path: Optional[Path], file_path: str) -> Optional[ProcessedData]:
+        """Load a cached result and re-point it at the requested file"""
+        if cache_path is None or not cache_path.exists():
+            return None
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                result = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_path.name}: {str(e)}")
+            return None
+        
+        # Same content may live at another path; each load is a distinct data item
+        result.source_path = file_path
+        if hasattr(result, 'image_path'):
+            result.image_path = file_path
+        result.data_id = f"{result.data_id.split('_')[0]}_{uuid.uuid4().hex[:8]}"
+        
+        logger.info(f"Loaded cached result for {file_path}")
+        return result
+    
+    def _store_cached(self, cache_path: Optional[Path], result: ProcessedData):
+        """Persist a successful result for later runs"""
+        if cache_path is None or result.status != ProcessingStatus.COMPLETED:
+            return
+        
+        try:
+            tmp_path = cache_path.with_suffix(f".{uuid.uuid4().hex[:8]}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(cache_path)
+        except Exception as e:
+            logger.warning(f"Could not cache processed result: {str(e)}")
+    
+    def _exists(self, file_path: str) -> bool:
+        """Check a batch entry exists, logging the ones that are skipped"""
+        if Path(file_path).exists():
+            return True
+        
+        logger.error(f"Failed to process {file_path}: File not found: {file_path}")
+        return False
+    
     def _create_batch(self, processed_items: List[ProcessedData]) -> DataBatch:
         """Create a DataBatch from processed items"""
         batch_id = f"batch_{uuid.uuid4().hex[:8]}"
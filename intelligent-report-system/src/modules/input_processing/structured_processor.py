@@ -5,7 +5,7 @@ Handles CSV, Excel, and database data
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 from sqlalchemy import create_engine, inspect
 import uuid
 
@@ -27,8 +27,12 @@ class StructuredDataProcessor:
         try:
             logger.info(f"Processing CSV file: {file_path}")
             
+            # Large files are streamed in batches instead of loaded whole
+            if Path(file_path).stat().st_size > settings.CSV_STREAMING_THRESHOLD_MB * 1024 * 1024:
+                return self._process_csv_batched(file_path)
+            
             # Read CSV
-            df = pd.read_csv(file_path)
+            df = self._read_csv(file_path)
             
             # Generate unique ID
             data_id = f"struct_{uuid.uuid4().hex[:8]}"
@@ -168,6 +172,188 @@ class StructuredDataProcessor:
                 errors=[str(e)]
             )
     
+    def _polars_errors(self, pl) -> tuple:
+        """Polars parse/schema errors that should fall back to pandas"""
+        base = getattr(pl.exceptions, 'PolarsError', None)
+        if base is not None:
+            return (base,)
+        return (pl.exceptions.ComputeError, pl.exceptions.SchemaError, pl.exceptions.NoDataError)
+    
+    def _read_csv(self, file_path: str) -> pd.DataFrame:
+        """Read a CSV into pandas, parsing with Polars' multithreaded reader when enabled"""
+        if settings.USE_POLARS_CSV:
+            try:
+                import polars as pl
+            except ImportError as e:
+                logger.warning(f"Polars CSV reader unavailable, using pandas: {str(e)}")
+            else:
+                try:
+                    df = pl.read_csv(file_path, infer_schema_length=10000)
+                    return df.to_pandas()
+                except self._polars_errors(pl) as e:
+                    # e.g. a dtype change past the inferred rows or ragged lines
+                    logger.warning(f"Polars could not parse {file_path}, using pandas: {str(e)}")
+        
+        return pd.read_csv(file_path)
+    
+    def _iter_csv_batches(self, file_path: str) -> Iterator[pd.DataFrame]:
+        """Yield a CSV as pandas chunks of CSV_BATCH_SIZE rows"""
+        rows_yielded = 0
+        
+        if settings.USE_POLARS_CSV:
+            try:
+                import polars as pl
+            except ImportError as e:
+                logger.warning(f"Polars CSV reader unavailable, using pandas: {str(e)}")
+            else:
+                try:
+                    # Schema is inferred once up front so every batch shares the same dtypes
+                    reader = pl.read_csv_batched(
+                        file_path,
+                        batch_size=settings.CSV_BATCH_SIZE,
+                        infer_schema_length=10000
+                    )
+                    while True:
+                        batches = reader.next_batches(settings.MAX_WORKERS)
+                        if not batches:
+                            return
+                        for batch in batches:
+                            yield batch.to_pandas()
+                            rows_yielded += len(batch)
+                except self._polars_errors(pl) as e:
+                    logger.warning(
+                        f"Polars could not parse {file_path} after {rows_yielded} rows, "
+                        f"continuing with pandas: {str(e)}"
+                    )
+        
+        # Resume after any rows Polars already delivered (row 0 is the header)
+        skiprows = range(1, rows_yielded + 1) if rows_yielded else None
+        yield from pd.read_csv(file_path, chunksize=settings.CSV_BATCH_SIZE, skiprows=skiprows)
+    
+    def _process_csv_batched(self, file_path: str) -> StructuredData:
+        """
+        Process a large CSV batch by batch; memory is bounded by CSV_BATCH_SIZE + CSV_SAMPLE_ROWS.
+        Row count, nulls, mean, std, min and max are exact (merged per batch); the rows
+        passed on for analysis are a uniform sample in file order, and median/quartiles
+        are computed from that sample
+        """
+        logger.info(f"Streaming large CSV in batches of {settings.CSV_BATCH_SIZE} rows")
+        
+        sample_size = settings.CSV_SAMPLE_ROWS
+        rng = np.random.default_rng(0)  # Fixed so the same file yields the same sample
+        sample: Optional[pd.DataFrame] = None
+        row_count = 0
+        columns: List[str] = []
+        data_types: Dict[str, str] = {}
+        null_counts: Dict[str, int] = {}
+        moments: Dict[str, List[float]] = {}  # col -> [count, mean, M2, min, max]
+        
+        for chunk in self._iter_csv_batches(file_path):
+            # Schema comes from the first batch
+            if not columns:
+                columns = chunk.columns.tolist()
+                data_types = {col: str(dtype) for col, dtype in chunk.dtypes.items()}
+                null_counts = {col: 0 for col in columns}
+                moments = {
+                    col: [0, 0.0, 0.0, np.inf, -np.inf]
+                    for col in chunk.select_dtypes(include=[np.number]).columns
+                }
+            
+            for col, count in chunk.isnull().sum().items():
+                null_counts[col] += int(count)
+            
+            for col, acc in moments.items():
+                values = chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                self._merge_moments(acc, values[~np.isnan(values)])
+            
+            # Bottom-k sampling on random keys keeps a uniform sample of at most sample_size rows
+            chunk = chunk.assign(
+                _row=np.arange(row_count, row_count + len(chunk)),
+                _key=rng.random(len(chunk))
+            )
+            row_count += len(chunk)
+            candidates = chunk if sample is None else pd.concat([sample, chunk], ignore_index=True)
+            sample = candidates.nsmallest(sample_size, '_key') if len(candidates) > sample_size else candidates
+        
+        sample = sample.sort_values('_row') if sample is not None else pd.DataFrame(columns=columns)
+        
+        summary_stats = {}
+        for col, (count, mean, m2, min_value, max_value) in moments.items():
+            stats = self._column_stats(sample[col].to_numpy(dtype=np.float64, na_value=np.nan))
+            if count:
+                stats.update({
+                    'mean': float(mean),
+                    'std': float(np.sqrt(m2 / (count - 1))) if count > 1 else None,
+                    'min': float(min_value),
+                    'max': float(max_value),
+                })
+            summary_stats[col] = stats
+        
+        metadata = StructuredMetadata(
+            row_count=row_count,
+            column_count=len(columns),
+            columns=columns,
+            data_types=data_types,
+            null_counts=null_counts,
+            summary_stats=summary_stats
+        )
+        
+        processed_content = {
+            'data': sample.drop(columns=['_row', '_key'], errors='ignore').to_dict(orient='records'),
+            'columns': columns,
+            'index': sample['_row'].tolist() if '_row' in sample else []
+        }
+        
+        logger.info(
+            f"Successfully processed CSV with {row_count} rows and {len(columns)} columns "
+            f"({len(processed_content['data'])} rows sampled)"
+        )
+        return StructuredData(
+            data_id=f"struct_{uuid.uuid4().hex[:8]}",
+            source_type=SourceType.CSV,
+            source_path=file_path,
+            processed_content=processed_content,
+            metadata=metadata,
+            status=ProcessingStatus.COMPLETED,
+            processing_steps=["read_csv_batched", "extract_metadata", "sample_rows", "convert_to_dict"]
+        )
+    
+    def _merge_moments(self, acc: List[float], values: np.ndarray):
+        """Fold a batch into running [count, mean, M2, min, max] (Chan et al. parallel update)"""
+        n = values.size
+        if n == 0:
+            return
+        
+        count, mean, m2 = acc[0], acc[1], acc[2]
+        batch_mean = values.mean()
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+        total = count + n
+        delta = batch_mean - mean
+        
+        acc[0] = total
+        acc[1] = mean + delta * n / total
+        acc[2] = m2 + batch_m2 + delta * delta * count * n / total
+        acc[3] = min(acc[3], float(values.min()))
+        acc[4] = max(acc[4], float(values.max()))
+    
+    def _column_stats(self, values: np.ndarray) -> Dict[str, Optional[float]]:
+        """Summary statistics for one numeric column (NaN-aware, pandas semantics)"""
+        values = values[~np.isnan(values)]
+        
+        if values.size == 0:
+            return {key: None for key in ('mean', 'median', 'std', 'min', 'max', 'q25', 'q75')}
+        
+        q25, median, q75 = np.quantile(values, [0.25, 0.5, 0.75])
+        return {
+            'mean': float(values.mean()),
+            'median': float(median),
+            'std': float(values.std(ddof=1)) if values.size > 1 else None,
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'q25': float(q25),
+            'q75': float(q75),
+        }
+    
     def _extract_metadata(self, df: pd.DataFrame) -> StructuredMetadata:
         """Extract metadata from DataFrame"""
         try:
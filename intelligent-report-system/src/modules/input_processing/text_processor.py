@@ -4,7 +4,8 @@ Handles text documents, PDFs, Word files, and plain text
 """
 import spacy
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from functools import lru_cache
 import uuid
 import re
 from docx import Document
@@ -17,21 +18,35 @@ from src.modules.input_processing.models import (
 from src.utils.logger import app_logger as logger
 from src.config.settings import settings
 
+@lru_cache(maxsize=None)
+def load_spacy_model(model_name: str, exclude: Tuple[str, ...] = ()):
+    """Load a spaCy model once per (model, excluded pipes) and reuse it"""
+    # GPU allocation must happen before the model is loaded
+    if settings.USE_GPU:
+        if spacy.prefer_gpu():
+            logger.info("spaCy running on GPU")
+        else:
+            logger.warning("USE_GPU is set but no GPU is available, using CPU")
+    
+    try:
+        nlp = spacy.load(model_name, exclude=list(exclude))
+        logger.info(f"Loaded spaCy model: {model_name}")
+    except OSError:
+        logger.warning(f"spaCy model {model_name} not found. Downloading...")
+        import subprocess
+        subprocess.run(["python", "-m", "spacy", "download", model_name])
+        nlp = spacy.load(model_name, exclude=list(exclude))
+    
+    return nlp
+
 class TextDataProcessor:
     """Process text data from various sources"""
     
     def __init__(self):
         logger.info("Initializing TextDataProcessor")
         
-        # Load spaCy model
-        try:
-            self.nlp = spacy.load(settings.SPACY_MODEL)
-            logger.info(f"Loaded spaCy model: {settings.SPACY_MODEL}")
-        except OSError:
-            logger.warning(f"spaCy model {settings.SPACY_MODEL} not found. Downloading...")
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", settings.SPACY_MODEL])
-            self.nlp = spacy.load(settings.SPACY_MODEL)
+        # Load spaCy model (shared across processor instances)
+        self.nlp = load_spacy_model(settings.SPACY_MODEL, tuple(settings.SPACY_EXCLUDE))
         
         # Load sentiment analysis pipeline
         try:
@@ -52,10 +67,7 @@ class TextDataProcessor:
         try:
             logger.info(f"Processing text file: {file_path}")
             
-            # Read text
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
-            
+            text = self._read_text_file(file_path)
             return self._process_text_content(text, file_path, SourceType.TXT)
             
         except Exception as e:
@@ -67,15 +79,7 @@ class TextDataProcessor:
         try:
             logger.info(f"Processing PDF file: {file_path}")
             
-            text = ""
-            with open(file_path, 'rb') as f:
-                pdf_reader = PyPDF2.PdfReader(f)
-                num_pages = len(pdf_reader.pages)
-                
-                for page_num in range(num_pages):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text() + "\n\n"
-            
+            text = self._read_pdf(file_path)
             return self._process_text_content(text, file_path, SourceType.PDF)
             
         except Exception as e:
@@ -87,32 +91,142 @@ class TextDataProcessor:
         try:
             logger.info(f"Processing DOCX file: {file_path}")
             
-            doc = Document(file_path)
-            text = "\n\n".join([paragraph.text for paragraph in doc.paragraphs])
-            
+            text = self._read_docx(file_path)
             return self._process_text_content(text, file_path, SourceType.DOCX)
             
         except Exception as e:
             logger.error(f"Error processing DOCX file: {str(e)}")
             return self._create_failed_result(file_path, SourceType.DOCX, str(e))
     
-    def _process_text_content(self, text: str, source_path: str, source_type: SourceType) -> TextData:
+    def process_files(self, file_paths: List[str]) -> List[TextData]:
+        """Process several documents with one batched spaCy pass"""
+        logger.info(f"Processing {len(file_paths)} text files in batch")
+        
+        readers = {
+            '.txt': (self._read_text_file, SourceType.TXT),
+            '.pdf': (self._read_pdf, SourceType.PDF),
+            '.docx': (self._read_docx, SourceType.DOCX),
+            '.doc': (self._read_docx, SourceType.DOCX)
+        }
+        
+        results: List[Optional[TextData]] = [None] * len(file_paths)
+        texts, source_paths, source_types, positions = [], [], [], []
+        
+        # Read every document first so the NLP stage sees the whole batch
+        for index, file_path in enumerate(file_paths):
+            suffix = Path(file_path).suffix.lower()
+            
+            if suffix not in readers:
+                results[index] = self._create_failed_result(
+                    file_path,
+                    SourceType.TXT,
+                    f"Unsupported file format: {suffix}"
+                )
+                continue
+            
+            reader, source_type = readers[suffix]
+            try:
+                texts.append(reader(file_path))
+                source_paths.append(file_path)
+                source_types.append(source_type)
+                positions.append(index)
+            except Exception as e:
+                logger.error(f"Error reading {file_path}: {str(e)}")
+                results[index] = self._create_failed_result(file_path, source_type, str(e))
+        
+        for index, text_data in zip(positions, self.process_texts(texts, source_paths, source_types)):
+            results[index] = text_data
+        
+        return results
+    
+    def process_texts(
+        self,
+        texts: List[str],
+        source_paths: Optional[List[str]] = None,
+        source_types: Optional[List[SourceType]] = None
+    ) -> List[TextData]:
+        """Process many texts, streaming them through nlp.pipe in batches"""
+        source_paths = source_paths or ["<memory>"] * len(texts)
+        source_types = source_types or [SourceType.TXT] * len(texts)
+        
+        cleaned_texts = [self._clean_text(text) for text in texts]
+        docs = [None] * len(texts)
+        
+        # Empty texts are skipped (they break multi-process pipes) and parsed individually later
+        positions = [index for index, text in enumerate(cleaned_texts) if text.strip()]
+        # Worker processes cannot share a GPU model, so GPU runs stay single-process
+        n_process = settings.SPACY_N_PROCESS if len(positions) > 1 and not settings.USE_GPU else 1
+        
+        try:
+            parsed = self.nlp.pipe(
+                (cleaned_texts[index][:settings.MAX_TEXT_LENGTH] for index in positions),
+                batch_size=settings.SPACY_BATCH_SIZE,
+                n_process=n_process
+            )
+            for index, doc in zip(positions, parsed):
+                docs[index] = doc
+        except Exception as e:
+            logger.error(f"Error in batched spaCy pass, falling back to per-text: {str(e)}")
+            docs = [None] * len(texts)
+        
+        return [
+            self._process_text_content(text, source_path, source_type, cleaned_text, doc)
+            for text, source_path, source_type, cleaned_text, doc
+            in zip(texts, source_paths, source_types, cleaned_texts, docs)
+        ]
+    
+    def _read_text_file(self, file_path: str) -> str:
+        """Read a plain text file"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    def _read_pdf(self, file_path: str) -> str:
+        """Extract text from every page of a PDF"""
+        text = ""
+        with open(file_path, 'rb') as f:
+            pdf_reader = PyPDF2.PdfReader(f)
+            num_pages = len(pdf_reader.pages)
+            
+            for page_num in range(num_pages):
+                page = pdf_reader.pages[page_num]
+                text += page.extract_text() + "\n\n"
+        
+        return text
+    
+    def _read_docx(self, file_path: str) -> str:
+        """Extract paragraph text from a Word document"""
+        doc = Document(file_path)
+        return "\n\n".join([paragraph.text for paragraph in doc.paragraphs])
+    
+    def _process_text_content(
+        self,
+        text: str,
+        source_path: str,
+        source_type: SourceType,
+        cleaned_text: Optional[str] = None,
+        doc=None
+    ) -> TextData:
         """Process text content and extract features"""
         try:
             # Generate unique ID
             data_id = f"text_{uuid.uuid4().hex[:8]}"
             
             # Clean text
-            cleaned_text = self._clean_text(text)
+            if cleaned_text is None:
+                cleaned_text = self._clean_text(text)
+            
+            # Parse once; entities and key phrases share the same Doc
+            if doc is None:
+                doc = self._parse(cleaned_text)
             
             # Extract entities
-            entities = self._extract_entities(cleaned_text)
+            entities = self._extract_entities(doc)
             
             # Analyze sentiment
             sentiment = self._analyze_sentiment(cleaned_text)
             
             # Extract key phrases
-            key_phrases = self._extract_key_phrases(cleaned_text)
+            key_phrases = self._extract_key_phrases(doc)
             
             # Count words and sentences
             word_count = len(cleaned_text.split())
@@ -161,17 +275,27 @@ class TextDataProcessor:
         text = re.sub(r'[^\w\s.,!?;:\-\'\"()]', '', text)
         return text.strip()
     
-    def _extract_entities(self, text: str) -> List[Entity]:
-        """Extract named entities using spaCy"""
-        entities = []
-        
+    def _parse(self, text: str):
+        """Run the spaCy pipeline on a single text"""
         try:
             # Limit text length for processing
             if len(text) > settings.MAX_TEXT_LENGTH:
                 text = text[:settings.MAX_TEXT_LENGTH]
             
-            doc = self.nlp(text)
+            return self.nlp(text)
             
+        except Exception as e:
+            logger.error(f"Error parsing text: {str(e)}")
+            return None
+    
+    def _extract_entities(self, doc) -> List[Entity]:
+        """Extract named entities from a spaCy Doc"""
+        entities = []
+        
+        if doc is None:
+            return entities
+        
+        try:
             for ent in doc.ents:
                 entity = Entity(
                     text=ent.text,
@@ -213,17 +337,14 @@ class TextDataProcessor:
             logger.error(f"Error analyzing sentiment: {str(e)}")
             return None
     
-    def _extract_key_phrases(self, text: str) -> List[str]:
+    def _extract_key_phrases(self, doc) -> List[str]:
         """Extract key phrases using noun chunks"""
         key_phrases = []
         
+        if doc is None:
+            return key_phrases
+        
         try:
-            # Limit text length
-            if len(text) > settings.MAX_TEXT_LENGTH:
-                text = text[:settings.MAX_TEXT_LENGTH]
-            
-            doc = self.nlp(text)
-            
             # Extract noun chunks
             for chunk in doc.noun_chunks:
                 if len(chunk.text.split()) >= 2:  # Multi-word phrases
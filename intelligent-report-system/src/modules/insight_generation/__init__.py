@@ -15,8 +15,23 @@ from src.modules.insight_generation.models import (
     DataProvenance,
     ExplanationComponent
 )
-from src.modules.insight_generation.statistical_analyzer import StatisticalAnalyzer
-from src.modules.insight_generation.generator import InsightGenerator
+
+# Analyzer classes are resolved lazily (PEP 562) so importing the package's
+# models does not pay for the numeric stack up front
+_LAZY_IMPORTS = {
+    'StatisticalAnalyzer': 'src.modules.insight_generation.statistical_analyzer',
+    'InsightGenerator': 'src.modules.insight_generation.generator',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'Insight',
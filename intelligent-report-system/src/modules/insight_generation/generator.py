@@ -6,6 +6,7 @@ import pandas as pd
 from typing import List, Optional
 import uuid
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from src.modules.insight_generation.models import (
     Insight, InsightCollection, InsightGenerationConfig, InsightSeverity
@@ -14,6 +15,7 @@ from src.modules.insight_generation.statistical_analyzer import StatisticalAnaly
 from src.modules.input_processing.models import ProcessedData, StructuredData
 from src.modules.role_context.models import RoleContext, InsightRequirement
 from src.utils.logger import app_logger as logger
+from src.config.settings import settings
 
 class InsightGenerator:
     """Generate actionable insights from data"""
@@ -79,48 +81,53 @@ class InsightGenerator:
                 logger.warning("No numeric columns for analysis")
                 return insights
             
+            # Collect the independent detection tasks; each only reads df
+            analyzer = self.statistical_analyzer
+            tasks = []
+            
             # Detect trends
             if self.config.detect_trends and len(numeric_cols) > 0:
                 for col in numeric_cols[:3]:  # Analyze top 3 numeric columns
-                    try:
-                        trend_insights = self.statistical_analyzer.detect_trends(
-                            df, col, min_data_points=self.config.trend_min_data_points
-                        )
-                        insights.extend(trend_insights)
-                    except Exception as e:
-                        logger.error(f"Error detecting trends in {col}: {str(e)}")
+                    tasks.append((
+                        f"detecting trends in {col}", analyzer.detect_trends,
+                        (df, col), {'min_data_points': self.config.trend_min_data_points}
+                    ))
             
             # Detect anomalies
             if self.config.detect_anomalies and len(numeric_cols) > 0:
                 for col in numeric_cols[:2]:  # Analyze top 2 columns
-                    try:
-                        anomaly_insights = self.statistical_analyzer.detect_anomalies(
-                            df, col, threshold=self.config.anomaly_threshold
-                        )
-                        insights.extend(anomaly_insights)
-                    except Exception as e:
-                        logger.error(f"Error detecting anomalies in {col}: {str(e)}")
+                    tasks.append((
+                        f"detecting anomalies in {col}", analyzer.detect_anomalies,
+                        (df, col), {'threshold': self.config.anomaly_threshold}
+                    ))
             
             # Detect correlations
             if self.config.detect_correlations and len(numeric_cols) >= 2:
-                try:
-                    corr_insights = self.statistical_analyzer.detect_correlations(
-                        df, threshold=self.config.correlation_threshold
-                    )
-                    insights.extend(corr_insights)
-                except Exception as e:
-                    logger.error(f"Error detecting correlations: {str(e)}")
+                tasks.append((
+                    "detecting correlations", analyzer.detect_correlations,
+                    (df,), {'threshold': self.config.correlation_threshold}
+                ))
             
             # Compare groups if categorical columns exist
             categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
             if len(categorical_cols) > 0 and len(numeric_cols) > 0:
-                try:
-                    comp_insights = self.statistical_analyzer.compare_groups(
-                        df, categorical_cols[0], numeric_cols[0]
-                    )
-                    insights.extend(comp_insights)
-                except Exception as e:
-                    logger.error(f"Error comparing groups: {str(e)}")
+                tasks.append((
+                    "comparing groups", analyzer.compare_groups,
+                    (df, categorical_cols[0], numeric_cols[0]), {}
+                ))
+            
+            # Run them on a thread pool (numpy/pandas/scipy release the GIL);
+            # results are gathered in submission order so output stays deterministic
+            with ThreadPoolExecutor(max_workers=settings.MAX_WORKERS) as executor:
+                futures = [
+                    (label, executor.submit(func, *args, **kwargs))
+                    for label, func, args, kwargs in tasks
+                ]
+                for label, future in futures:
+                    try:
+                        insights.extend(future.result())
+                    except Exception as e:
+                        logger.error(f"Error {label}: {str(e)}")
             
         except Exception as e:
             logger.error(f"Error generating insights from structured data: {str(e)}")
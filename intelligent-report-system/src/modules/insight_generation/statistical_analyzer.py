@@ -5,8 +5,6 @@ Performs statistical analysis to detect trends, anomalies, and correlations
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Tuple, Optional
-from scipy import stats
-from sklearn.ensemble import IsolationForest
 import uuid
 
 from src.modules.insight_generation.models import (
@@ -19,9 +17,17 @@ class StatisticalAnalyzer:
     """Performs statistical analysis on data"""
     
     def __init__(self):
-        self.anomaly_detector = IsolationForest(contamination=0.1, random_state=42)
+        self._anomaly_detector = None
         logger.info("StatisticalAnalyzer initialized")
     
+    @property
+    def anomaly_detector(self):
+        """IsolationForest model, built on first use so sklearn loads lazily"""
+        if self._anomaly_detector is None:
+            from sklearn.ensemble import IsolationForest
+            self._anomaly_detector = IsolationForest(contamination=0.1, random_state=42)
+        return self._anomaly_detector
+    
     def detect_trends(
         self,
         df: pd.DataFrame,
@@ -45,7 +51,8 @@ class StatisticalAnalyzer:
             # Get values
             values = df[value_column].values
             
-            # Calculate trend using linear regression
+            # Calculate trend using linear regression (scipy is imported on first use)
+            from scipy import stats
             x = np.arange(len(values))
             slope, intercept, r_value, p_value, std_err = stats.linregress(x, values)
             
@@ -255,85 +262,91 @@ class StatisticalAnalyzer:
                 logger.warning("Insufficient numeric columns for correlation analysis")
                 return insights
             
-            # Calculate correlation matrix
-            corr_matrix = df[numeric_cols].corr()
+            # Calculate correlation matrix on a contiguous float64 array
+            values = df[numeric_cols].to_numpy(dtype=np.float64)
+            if np.isnan(values).any():
+                # Pairwise NaN handling needs pandas
+                corr_matrix = df[numeric_cols].corr().to_numpy()
+            else:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    corr_matrix = np.corrcoef(values, rowvar=False)
+            
+            # Select strong pairs from the upper triangle in one vectorized pass
+            rows, cols = np.triu_indices(len(numeric_cols), k=1)
+            pair_corrs = corr_matrix[rows, cols]
+            strong = np.abs(pair_corrs) >= threshold
             
-            # Find strong correlations
-            for i in range(len(numeric_cols)):
-                for j in range(i + 1, len(numeric_cols)):
-                    corr_value = corr_matrix.iloc[i, j]
-                    
-                    if abs(corr_value) >= threshold:
-                        col_a = numeric_cols[i]
-                        col_b = numeric_cols[j]
-                        
-                        # Determine relationship type
-                        if corr_value > 0:
-                            relationship_type = "positive"
-                        elif corr_value < 0:
-                            relationship_type = "negative"
-                        else:
-                            relationship_type = "none"
-                        
-                        # Determine severity
-                        if abs(corr_value) > 0.8:
-                            severity = InsightSeverity.HIGH
-                        elif abs(corr_value) > 0.6:
-                            severity = InsightSeverity.MEDIUM
-                        else:
-                            severity = InsightSeverity.LOW
-                        
-                        # Create narrative
-                        narrative = self._generate_correlation_narrative(
-                            col_a, col_b, corr_value, relationship_type
-                        )
-                        
-                        # Create provenance
-                        provenance = DataProvenance(
-                            source_id=f"corr_{uuid.uuid4().hex[:8]}",
-                            source_type="dataframe",
-                            source_path=f"{col_a}_vs_{col_b}",
-                            data_points_used=len(df),
-                            quality_score=0.85
-                        )
-                        
-                        # Create explanation
-                        explanation = ExplanationComponent(
-                            component_type="statistical_analysis",
-                            content=f"Pearson correlation coefficient: {corr_value:.3f}",
-                            confidence=abs(corr_value),
-                            supporting_data={
-                                "correlation": float(corr_value),
-                                "sample_size": len(df)
-                            }
-                        )
-                        
-                        # Create insight
-                        insight = CorrelationInsight(
-                            insight_id=f"corr_{uuid.uuid4().hex[:8]}",
-                            severity=severity,
-                            title=f"{relationship_type.title()} Correlation: {col_a} & {col_b}",
-                            description=f"Strong {relationship_type} relationship detected",
-                            narrative=narrative,
-                            confidence_score=abs(corr_value),
-                            relevance_score=abs(corr_value),
-                            impact_score=abs(corr_value) * 0.8,
-                            data_provenance=[provenance],
-                            explanations=[explanation],
-                            variable_a=col_a,
-                            variable_b=col_b,
-                            correlation_coefficient=float(corr_value),
-                            relationship_type=relationship_type,
-                            statistical_significance=0.95,  # Simplified
-                            key_metrics={
-                                "correlation": float(corr_value),
-                                "sample_size": len(df)
-                            },
-                            visualizations=["scatter_plot", "correlation_matrix"],
-                            tags=["correlation", "relationship"]
-                        )
-                        
-                        insights.append(insight)
+            for i, j, corr_value in zip(rows[strong], cols[strong], pair_corrs[strong]):
+                col_a = numeric_cols[i]
+                col_b = numeric_cols[j]
+                
+                # Determine relationship type
+                if corr_value > 0:
+                    relationship_type = "positive"
+                elif corr_value < 0:
+                    relationship_type = "negative"
+                else:
+                    relationship_type = "none"
+                
+                # Determine severity
+                if abs(corr_value) > 0.8:
+                    severity = InsightSeverity.HIGH
+                elif abs(corr_value) > 0.6:
+                    severity = InsightSeverity.MEDIUM
+                else:
+                    severity = InsightSeverity.LOW
+                
+                # Create narrative
+                narrative = self._generate_correlation_narrative(
+                    col_a, col_b, corr_value, relationship_type
+                )
+                
+                # Create provenance
+                provenance = DataProvenance(
+                    source_id=f"corr_{uuid.uuid4().hex[:8]}",
+                    source_type="dataframe",
+                    source_path=f"{col_a}_vs_{col_b}",
+                    data_points_used=len(df),
+                    quality_score=0.85
+                )
+                
+                # Create explanation
+                explanation = ExplanationComponent(
+                    component_type="statistical_analysis",
+                    content=f"Pearson correlation coefficient: {corr_value:.3f}",
+                    confidence=abs(corr_value),
+                    supporting_data={
+                        "correlation": float(corr_value),
+                        "sample_size": len(df)
+                    }
+                )
+                
+                # Create insight
+                insight = CorrelationInsight(
+                    insight_id=f"corr_{uuid.uuid4().hex[:8]}",
+                    severity=severity,
+                    title=f"{relationship_type.title()} Correlation: {col_a} & {col_b}",
+                    description=f"Strong {relationship_type} relationship detected",
+                    narrative=narrative,
+                    confidence_score=abs(corr_value),
+                    relevance_score=abs(corr_value),
+                    impact_score=abs(corr_value) * 0.8,
+                    data_provenance=[provenance],
+                    explanations=[explanation],
+                    variable_a=col_a,
+                    variable_b=col_b,
+                    correlation_coefficient=float(corr_value),
+                    relationship_type=relationship_type,
+                    statistical_significance=0.95,  # Simplified
+                    key_metrics={
+                        "correlation": float(corr_value),
+                        "sample_size": len(df)
+                    },
+                    visualizations=["scatter_plot", "correlation_matrix"],
+                    tags=["correlation", "relationship"]
+                )
+                
+                insights.append(insight)
             
             logger.info(f"Detected {len(insights)} correlations")
             
@@ -3,7 +3,9 @@ Role-Context Analyzer
 Maps roles to data requirements and filters data accordingly
 """
 from typing import List, Dict, Any, Optional
+import heapq
 import pandas as pd
+import numpy as np
 from datetime import datetime
 
 from src.modules.role_context.models import (
@@ -78,15 +80,32 @@ class RoleContextAnalyzer:
         # Convert to DataFrame for filtering
         df = pd.DataFrame(data.processed_content['data'])
         
+        # Build one row mask from all filters and apply it in a single vectorized pass
+        mask = np.ones(len(df), dtype=bool)
+        
         # Apply department filter
         if 'department' in df.columns:
             accessible_depts = [d.value for d in role.accessible_departments]
-            df = df[df['department'].isin(accessible_depts)]
+            mask &= df['department'].isin(accessible_depts).to_numpy()
         
         # Apply region filter
         if role.accessible_regions and 'region' in df.columns:
             if 'assigned_region' not in role.accessible_regions:
-                df = df[df['region'].isin(role.accessible_regions)]
+                mask &= df['region'].isin(role.accessible_regions).to_numpy()
+        
+        # Apply request-specific filters (e.g. {"region": "North"})
+        for column, value in role_context.specific_filters.items():
+            if column not in df.columns:
+                logger.debug(f"Ignoring filter on missing column: {column}")
+                continue
+            
+            if isinstance(value, (list, tuple, set, frozenset)):
+                mask &= df[column].isin(list(value)).to_numpy()
+            else:
+                mask &= (df[column] == value).to_numpy()
+        
+        if not mask.all():
+            df = df[mask]
         
         # Apply financial data filter
         if not access_policy.can_view_financial:
@@ -165,23 +184,12 @@ class RoleContextAnalyzer:
     def get_relevant_kpis(self, role_id: str) -> List[str]:
         """Get KPI names relevant to a role"""
         
-        role = self.role_repository.get_role(role_id)
-        if not role:
-            return []
-        
-        kpi_names = [kpi.name for kpi in role.primary_kpis]
-        kpi_names.extend([kpi.name for kpi in role.secondary_kpis])
-        
-        return kpi_names
+        return list(self.role_repository.kpi_names.get(role_id, ()))
     
     def should_alert(self, role_id: str, alert_type: str) -> bool:
         """Check if role should be alerted for specific event"""
         
-        role = self.role_repository.get_role(role_id)
-        if not role:
-            return False
-        
-        return alert_type in role.alert_triggers
+        return self.role_repository.has_alert_trigger(role_id, alert_type)
     
     def get_insight_requirements(self, role_id: str) -> InsightRequirement:
         """Get insight requirements for a role"""
@@ -222,39 +230,42 @@ class RoleContextAnalyzer:
     def prioritize_data_sources(
         self,
         data_items: List[ProcessedData],
-        role_context: RoleContext
+        role_context: RoleContext,
+        top_k: Optional[int] = None
     ) -> List[ProcessedData]:
-        """Prioritize data sources based on role relevance"""
+        """Prioritize data sources based on role relevance (optionally only the top_k)"""
         
         role = role_context.role_profile
-        scored_items = []
         
-        for item in data_items:
-            score = 0
-            
-            # Score based on modality preference
-            if item.modality.value == "structured":
-                score += 10  # Most roles prefer structured data
-            
-            # Score based on focus areas (for text)
-            if isinstance(item, TextData) and hasattr(item.metadata, 'relevance_score'):
-                score += item.metadata.relevance_score * 5
-            
-            # Score based on department
-            if hasattr(item, 'department'):
-                if item.department in role.accessible_departments:
-                    score += 5
-            
-            scored_items.append((score, item))
-        
-        # Sort by score descending
-        scored_items.sort(key=lambda x: x[0], reverse=True)
-        
-        prioritized = [item for score, item in scored_items]
+        # Partial selection: O(n log k) instead of sorting everything
+        prioritized = heapq.nlargest(
+            top_k if top_k is not None else len(data_items),
+            data_items,
+            key=lambda item: self._score_data_item(item, role)
+        )
         
         logger.info(f"Prioritized {len(prioritized)} data sources for {role.role_name}")
         return prioritized
     
+    def _score_data_item(self, item: ProcessedData, role: RoleProfile) -> float:
+        """Relevance score of a data item for a role"""
+        score = 0
+        
+        # Score based on modality preference
+        if item.modality.value == "structured":
+            score += 10  # Most roles prefer structured data
+        
+        # Score based on focus areas (for text)
+        if isinstance(item, TextData) and hasattr(item.metadata, 'relevance_score'):
+            score += item.metadata.relevance_score * 5
+        
+        # Score based on department
+        if hasattr(item, 'department'):
+            if self.role_repository.can_access_department(role.role_id, item.department):
+                score += 5
+        
+        return score
+    
     def get_recommended_visualizations(self, role_id: str) -> List[str]:
         """Get recommended visualization types for role"""
         
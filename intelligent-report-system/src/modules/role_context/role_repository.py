@@ -2,7 +2,7 @@
 Role Repository
 Stores predefined organizational roles
 """
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, FrozenSet, Tuple
 from src.modules.role_context.models import (
     RoleProfile, KPI, RoleLevel, Department, DataGranularity,
     TemporalHorizon, VisualizationType, DecisionContext, DataAccessPolicy
@@ -15,7 +15,17 @@ class RoleRepository:
     def __init__(self):
         self.roles: Dict[str, RoleProfile] = {}
         self.access_policies: Dict[str, DataAccessPolicy] = {}
+        
+        # O(1) membership lookups, rebuilt whenever a role is added
+        self.alert_triggers: Dict[str, FrozenSet[str]] = {}
+        self.accessible_departments: Dict[str, FrozenSet[Department]] = {}
+        
+        # Ordered KPI names (primary first), precomputed per role
+        self.kpi_names: Dict[str, Tuple[str, ...]] = {}
+        
         self._initialize_default_roles()
+        for role in self.roles.values():
+            self._index_role(role)
         logger.info(f"RoleRepository initialized with {len(self.roles)} roles")
     
     def _initialize_default_roles(self):
@@ -205,6 +215,22 @@ class RoleRepository:
             pii_access_level="none"
         )
     
+    def _index_role(self, role: RoleProfile):
+        """Precompute lookup tables for a role"""
+        self.alert_triggers[role.role_id] = frozenset(role.alert_triggers)
+        self.accessible_departments[role.role_id] = frozenset(role.accessible_departments)
+        self.kpi_names[role.role_id] = tuple(
+            kpi.name for kpi in role.primary_kpis + role.secondary_kpis
+        )
+    
+    def has_alert_trigger(self, role_id: str, alert_type: str) -> bool:
+        """Check if an alert type triggers for a role"""
+        return alert_type in self.alert_triggers.get(role_id, frozenset())
+    
+    def can_access_department(self, role_id: str, department: Department) -> bool:
+        """Check if a role can access a department's data"""
+        return department in self.accessible_departments.get(role_id, frozenset())
+    
     def get_role(self, role_id: str) -> Optional[RoleProfile]:
         """Get role profile by ID"""
         return self.roles.get(role_id)
@@ -229,4 +255,5 @@ class RoleRepository:
         """Add custom role"""
         self.roles[role.role_id] = role
         self.access_policies[role.role_id] = access_policy
+        self._index_role(role)
         logger.info(f"Added custom role: {role.role_name}")
\ No newline at end of file
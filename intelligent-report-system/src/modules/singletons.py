@@ -0,0 +1,76 @@
+"""
+Shared module instances
+Stateless processors are created once per process so scripts, tests and
+demos running in the same interpreter load their models only once.
+Sample fixtures (data + insights) are additionally cached on disk
+"""
+from functools import lru_cache
+from typing import Optional
+
+# Bump when insight generation changes so cached sample insights are rebuilt
+SAMPLE_INSIGHTS_CACHE_VERSION = "1"
+
+@lru_cache(maxsize=None)
+def get_input_processor():
+    """Shared InputProcessor (holds the spaCy pipeline and OCR setup)"""
+    from src.modules.input_processing.processor import InputProcessor
+    return InputProcessor()
+
+@lru_cache(maxsize=None)
+def get_role_repository():
+    """Shared RoleRepository"""
+    from src.modules.role_context.role_repository import RoleRepository
+    return RoleRepository()
+
+@lru_cache(maxsize=None)
+def get_context_analyzer():
+    """Shared RoleContextAnalyzer"""
+    from src.modules.role_context.context_analyzer import RoleContextAnalyzer
+    return RoleContextAnalyzer()
+
+@lru_cache(maxsize=None)
+def get_insight_generator():
+    """Shared InsightGenerator with the default configuration"""
+    from src.modules.insight_generation.generator import InsightGenerator
+    return InsightGenerator()
+
+@lru_cache(maxsize=None)
+def get_sample_insights(num_rows: int, seed: Optional[int] = 42):
+    """
+    Sample sales data and its general insights, shared across scripts and runs.
+    Insights are pickled next to the processed-file cache, keyed on the CSV content
+    """
+    import hashlib
+    import pickle
+    from src.config.settings import settings
+    from src.utils.sample_data_generator import SampleDataGenerator
+    from src.utils.logger import app_logger as logger
+    
+    sales_file = SampleDataGenerator().generate_sales_data(num_rows=num_rows, seed=seed)
+    sales_data = get_input_processor().process_file(sales_file)
+    
+    # Same CSV content => same insights (for the default generator config)
+    hasher = hashlib.blake2b(f"{SAMPLE_INSIGHTS_CACHE_VERSION}|".encode(), digest_size=16)
+    with open(sales_file, 'rb') as f:
+        hasher.update(f.read())
+    cache_path = settings.PROCESSED_CACHE_DIR / f"insights_{hasher.hexdigest()}.pkl"
+    
+    if settings.CACHE_PROCESSED_FILES and cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                insights = pickle.load(f)
+            logger.info(f"Loaded cached insights for {sales_file}")
+            return sales_data, insights
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable insights cache {cache_path.name}: {str(e)}")
+    
+    insights = get_insight_generator().generate_insights(sales_data)
+    
+    if settings.CACHE_PROCESSED_FILES:
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(insights, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Could not cache insights: {str(e)}")
+    
+    return sales_data, insights
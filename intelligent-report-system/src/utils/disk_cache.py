@@ -0,0 +1,80 @@
+"""
+Disk memoization for methods that write an output file and return its path
+"""
+import functools
+import hashlib
+import inspect
+import pickle
+import shutil
+import orjson
+from pathlib import Path
+
+from src.config.settings import settings
+from src.utils.logger import app_logger as logger
+
+def _file_digest(path: Path) -> str:
+    """Content hash of a generated file"""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+def disk_memoize(func):
+    """
+    Skip regenerating a file when the method was already called with the same arguments.
+    
+    The decorated method must return the path of the file it wrote. Each distinct call
+    (keyed on the bound arguments) keeps its own copy of the output plus a small
+    ``<method>_<key>.json`` entry in ``settings.PROCESSED_CACHE_DIR`` (gitignored), so
+    calls with different arguments don't evict each other. On a hit the cached copy is
+    restored to the original output path only if that file was overwritten since.
+    """
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not settings.CACHE_SAMPLE_DATA:
+            return func(self, *args, **kwargs)
+        
+        # Key on the fully bound call so f(), f(1000) and f(num_rows=1000) match,
+        # plus the instance's output directory when it has one
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        call_args = tuple(bound.arguments.items())[1:]
+        output_dir = str(getattr(self, 'output_dir', ''))
+        key = hashlib.blake2b(
+            pickle.dumps((func.__qualname__, output_dir, call_args)), digest_size=16
+        ).hexdigest()
+        
+        cache_dir = Path(settings.PROCESSED_CACHE_DIR)
+        entry_file = cache_dir / f"{func.__name__}_{key}.json"
+        
+        # Check for a previous identical call whose cached copy is intact
+        try:
+            entry = orjson.loads(entry_file.read_bytes())
+            output_path = Path(entry['path'])
+            cached_copy = cache_dir / entry['copy']
+            if _file_digest(cached_copy) == entry['digest']:
+                if not output_path.exists() or _file_digest(output_path) != entry['digest']:
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(cached_copy, output_path)
+                logger.info(f"Reusing cached {func.__name__} output: {output_path}")
+                return str(output_path)
+        except (OSError, orjson.JSONDecodeError, KeyError):
+            pass
+        
+        result = func(self, *args, **kwargs)
+        
+        # Keep a per-call copy of the new output
+        try:
+            result_path = Path(result)
+            copy_name = f"{func.__name__}_{key}{result_path.suffix}"
+            shutil.copyfile(result_path, cache_dir / copy_name)
+            entry_file.write_bytes(orjson.dumps({
+                'path': str(result_path),
+                'copy': copy_name,
+                'digest': _file_digest(result_path)
+            }))
+        except OSError as e:
+            logger.warning(f"Could not cache {func.__name__} output: {str(e)}")
+        
+        return result
+    
+    return wrapper
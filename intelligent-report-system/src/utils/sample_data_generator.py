@@ -5,11 +5,12 @@ Creates synthetic data files for POC demonstration
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from datetime import datetime, timedelta
-import random
+from typing import Optional
+from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
 
 from src.config.settings import settings
+from src.utils.disk_cache import disk_memoize
 from src.utils.logger import app_logger as logger
 
 class SampleDataGenerator:
@@ -20,21 +21,41 @@ class SampleDataGenerator:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Sample data will be saved to: {self.output_dir}")
     
-    def generate_sales_data(self, num_rows: int = 1000) -> str:
-        """Generate sample sales CSV data"""
-        logger.info(f"Generating sales data with {num_rows} rows")
+    def generate_sales_data(self, num_rows: int = 1000, seed: Optional[int] = 42) -> str:
+        """
+        Generate sample sales CSV data.
+        A seeded call is memoized on disk, so repeat calls return the file from the
+        first run (dates are relative to that run). seed=None always generates fresh
+        random data dated back from today
+        """
+        if seed is None:
+            return self._write_sales_data(num_rows, seed)
+        return self._write_sales_data_cached(num_rows, seed)
+    
+    @disk_memoize
+    def _write_sales_data_cached(self, num_rows: int, seed: int) -> str:
+        """Seeded (memoized) sales data"""
+        return self._write_sales_data(num_rows, seed)
+    
+    def _write_sales_data(self, num_rows: int, seed: Optional[int]) -> str:
+        """Draw the sales rows and write them to sales_data.csv"""
+        logger.info(f"Generating sales data with {num_rows} rows (seed={seed})")
         
         regions = ['North', 'South', 'East', 'West', 'Central']
         products = ['Product A', 'Product B', 'Product C', 'Product D', 'Product E']
         sales_reps = [f'Rep_{i}' for i in range(1, 21)]
         
+        # Build every column in one vectorized draw
+        rng = np.random.default_rng(seed)
+        today = np.datetime64(datetime.now().date(), 'D')
+        
         data = {
-            'date': [datetime.now() - timedelta(days=random.randint(0, 365)) for _ in range(num_rows)],
-            'region': [random.choice(regions) for _ in range(num_rows)],
-            'product': [random.choice(products) for _ in range(num_rows)],
-            'sales_rep': [random.choice(sales_reps) for _ in range(num_rows)],
-            'quantity': np.random.randint(1, 100, num_rows),
-            'unit_price': np.random.uniform(10, 500, num_rows).round(2),
+            'date': today - rng.integers(0, 366, num_rows).astype('timedelta64[D]'),
+            'region': rng.choice(regions, num_rows),
+            'product': rng.choice(products, num_rows),
+            'sales_rep': rng.choice(sales_reps, num_rows),
+            'quantity': rng.integers(1, 100, num_rows),
+            'unit_price': rng.uniform(10, 500, num_rows).round(2),
         }
         
         df = pd.DataFrame(data)
@@ -50,6 +71,7 @@ class SampleDataGenerator:
         logger.info(f"Sales data saved to: {output_path}")
         return str(output_path)
     
+    @disk_memoize
     def generate_financial_report(self) -> str:
         """Generate sample financial report text"""
         logger.info("Generating financial report")
@@ -102,6 +124,7 @@ Investment in R&D and market expansion positions us favorably for continued grow
         logger.info(f"Financial report saved to: {output_path}")
         return str(output_path)
     
+    @disk_memoize
     def generate_customer_feedback(self) -> str:
         """Generate sample customer feedback document"""
         logger.info("Generating customer feedback document")
@@ -167,6 +190,7 @@ Customer Segments:
         logger.info(f"Customer feedback saved to: {output_path}")
         return str(output_path)
     
+    @disk_memoize
     def generate_sample_invoice_image(self) -> str:
         """Generate a simple invoice image for OCR testing"""
         logger.info("Generating sample invoice image")
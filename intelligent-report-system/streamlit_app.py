@@ -5,11 +5,10 @@ Run: streamlit run streamlit_app.py
 import streamlit as st
 import sys
 from pathlib import Path
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime
-import json
+import orjson
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 
 # Add project root to path
 project_root = Path(__file__).parent.absolute()
@@ -31,96 +30,17 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# # Custom CSS
-# st.markdown("""
-# <style>
-#     .main-header {
-#         font-size: 2.5rem;
-#         font-weight: bold;
-#         color: #1f77b4;
-#         text-align: center;
-#         margin-bottom: 2rem;
-#     }
-#     .metric-card {
-#         background-color: #f0f2f6;
-#         padding: 1rem;
-#         border-radius: 0.5rem;
-#         border-left: 4px solid #1f77b4;
-#     }
-#     .insight-card {
-#         background-color: #ffffff;
-#         padding: 1.5rem;
-#         border-radius: 0.5rem;
-#         border: 1px solid #e0e0e0;
-#         margin-bottom: 1rem;
-#         box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-#     }
-#     .stButton>button {
-#         width: 100%;
-#     }
-# </style>
-# """, unsafe_allow_html=True)
+# Chat history bounds
+CHAT_HISTORY_LIMIT = 200
+CHAT_PAGE_SIZE = 50
 
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background-color: rgba(240, 242, 246, 0.9);
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #1f77b4;
-    }
-    .insight-card {
-        background-color: rgba(255, 255, 255, 0.95);
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        border: 1px solid #e0e0e0;
-        margin-bottom: 1rem;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        color: #262730 !important;  /* Force dark text */
-    }
-    .insight-card h3 {
-        color: #1a1a1a !important;
-        margin-bottom: 0.5rem;
-        font-size: 1.3rem;
-    }
-    .insight-card p {
-        color: #3d3d3d !important;
-        line-height: 1.6;
-    }
-    .insight-card strong {
-        color: #1a1a1a !important;
-        font-weight: 600;
-    }
-    .stButton>button {
-        width: 100%;
-    }
-    
-    /* Dark mode support */
-    @media (prefers-color-scheme: dark) {
-        .insight-card {
-            background-color: rgba(38, 39, 48, 0.95);
-            border-color: #464646;
-            color: #e0e0e0 !important;
-        }
-        .insight-card h3 {
-            color: #ffffff !important;
-        }
-        .insight-card p {
-            color: #d0d0d0 !important;
-        }
-        .insight-card strong {
-            color: #ffffff !important;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS (read from disk once per process, emitted on every run)
+@st.cache_resource
+def load_css():
+    """Load the app stylesheet"""
+    return (project_root / "assets" / "style.css").read_text(encoding="utf-8")
+
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
 # Initialize session state
 if 'initialized' not in st.session_state:
@@ -132,8 +52,11 @@ if 'initialized' not in st.session_state:
     st.session_state.feedback_collector = None
     st.session_state.learning_engine = None
     st.session_state.insights = None
+    st.session_state.insight_type_options = ()
+    st.session_state.insight_severity_options = ()
     st.session_state.processed_data = None
-    st.session_state.chat_history = []
+    st.session_state.chat_history = deque(maxlen=CHAT_HISTORY_LIMIT)
+    st.session_state.chat_visible_count = CHAT_PAGE_SIZE
     st.session_state.session_id = None
 
 def initialize_system():
@@ -155,27 +78,41 @@ def create_metric_card(label, value, delta=None):
     with col1:
         st.metric(label, value, delta)
 
-def display_insight_card(insight, index):
-    """Display insight in a card format"""
-    severity_colors = {
-        "critical": "🔴",
-        "high": "🟠",
-        "medium": "🟡",
-        "low": "🟢",
-        "info": "🔵"
-    }
-    
-    severity_icon = severity_colors.get(insight.severity.value, "⚪")
+SEVERITY_COLORS = {
+    "critical": "🔴",
+    "high": "🟠",
+    "medium": "🟡",
+    "low": "🟢",
+    "info": "🔵"
+}
+
+@lru_cache(maxsize=1024)
+def render_card_html(insight_id, title, severity, insight_type, confidence, impact):
+    """Build the insight card HTML (memoized, insights are immutable once generated)"""
+    severity_icon = SEVERITY_COLORS.get(severity, "⚪")
     
-    with st.container():
-        st.markdown(f"""
+    return f"""
         <div class="insight-card">
-            <h3>{severity_icon} {insight.title}</h3>
-            <p><strong>Type:</strong> {insight.insight_type.value.title()} | 
-               <strong>Confidence:</strong> {insight.confidence_score:.1%} | 
-               <strong>Impact:</strong> {insight.impact_score:.1%}</p>
+            <h3>{severity_icon} {title}</h3>
+            <p><strong>Type:</strong> {insight_type.title()} | 
+               <strong>Confidence:</strong> {confidence:.1%} | 
+               <strong>Impact:</strong> {impact:.1%}</p>
         </div>
-        """, unsafe_allow_html=True)
+        """
+
+def display_insight_card(insight, index, feedback_collector, role_id):
+    """Display insight in a card format"""
+    card_html = render_card_html(
+        insight.insight_id,
+        insight.title,
+        insight.severity.value,
+        insight.insight_type.value,
+        insight.confidence_score,
+        insight.impact_score
+    )
+    
+    with st.container():
+        st.markdown(card_html, unsafe_allow_html=True)
         
         with st.expander("📊 View Details"):
             st.write("**Description:**", insight.description)
@@ -193,7 +130,13 @@ def display_insight_card(insight, index):
             
             if insight.key_metrics:
                 st.write("**Key Metrics:**")
-                st.json(insight.key_metrics)
+                st.code(
+                    orjson.dumps(
+                        insight.key_metrics,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                    ).decode(),
+                    language="json"
+                )
             
             # Feedback
             col1, col2, col3 = st.columns(3)
@@ -207,23 +150,68 @@ def display_insight_card(insight, index):
                 relevant = st.checkbox("Relevant", key=f"rel_{insight.insight_id}")
             with col3:
                 if st.button("Submit Feedback", key=f"fb_{insight.insight_id}"):
-                    st.session_state.feedback_collector.record_insight_feedback(
+                    feedback_collector.record_insight_feedback(
                         insight_id=insight.insight_id,
                         rating=rating,
                         is_relevant=relevant,
-                        role_id=st.session_state.selected_role
+                        role_id=role_id
                     )
                     st.success("Feedback recorded!")
 
+@st.cache_data(ttl=3600)
+def get_cached_role_context(_context_analyzer, role_id):
+    """Build the role context once per role"""
+    return _context_analyzer.create_role_context(role_id)
+
+@st.cache_data(ttl=3600)
+def get_cached_insight_requirements(_context_analyzer, role_id):
+    """Build the insight requirements once per role"""
+    return _context_analyzer.get_insight_requirements(role_id)
+
+@st.cache_data(ttl=300, hash_funcs={FeedbackCollector: id})
+def get_cached_feedback_summary(feedback_collector, days, feedback_count):
+    """Summarize feedback, recomputed only when new feedback arrives"""
+    return feedback_collector.get_feedback_summary(days=days)
+
+@st.cache_data(ttl=300, hash_funcs={FeedbackCollector: id})
+def get_cached_rating_timeseries(feedback_collector, days, feedback_count):
+    """Daily average ratings, recomputed only when new feedback arrives"""
+    return feedback_collector.get_rating_timeseries(days=days)
+
+def count_feedback(feedback_collector):
+    """Cheap feedback counter used to invalidate cached summaries"""
+    return (
+        sum(len(items) for items in feedback_collector.insight_feedback.values())
+        + len(feedback_collector.report_feedback)
+    )
+
+PAGES = {
+    "🏠 Home": "home",
+    "📊 Data Processing": "data",
+    "🔍 Insights": "insights",
+    "💬 Chat": "chat",
+    "📈 Learning": "learning",
+    "⚙️ Settings": "settings"
+}
+PAGE_SLUGS = list(PAGES.values())
+
+def on_page_change():
+    """Mirror the selected page into the URL so pages can be deep-linked"""
+    st.query_params["page"] = PAGES[st.session_state.page]
+
 # Sidebar
 with st.sidebar:
     # st.image("https://via.placeholder.com/300x100/1f77b4/ffffff?text=Intelligent+Reports", use_column_width=True)
     # st.image("https://via.placeholder.com/300x100/1f77b4/ffffff?text=Intelligent+Reports", use_container_width=True)
 
     st.markdown("### 🎯 Navigation")
+    requested_page = st.query_params.get("page", "home")
     page = st.radio(
         "Select Module",
-        ["🏠 Home", "📊 Data Processing", "🔍 Insights", "💬 Chat", "📈 Learning", "⚙️ Settings"],
+        list(PAGES.keys()),
+        index=PAGE_SLUGS.index(requested_page) if requested_page in PAGE_SLUGS else 0,
+        key="page",
+        on_change=on_page_change,
         label_visibility="collapsed"
     )
     
@@ -258,8 +246,9 @@ with st.sidebar:
         else:
             st.warning("🔄 Pattern Matching Mode")
 
-# Main content
-if page == "🏠 Home":
+# Page renderers
+def render_home():
+    """Render the landing page"""
     st.markdown('<p class="main-header">📊 Cognivue </p>', unsafe_allow_html=True)
     
     st.markdown("""
@@ -332,7 +321,10 @@ if page == "🏠 Home":
     else:
         st.warning("⚠️ Please initialize the system using the button in the sidebar.")
 
-elif page == "📊 Data Processing":
+def render_data_processing():
+    """Render the data processing page"""
+    import pandas as pd
+    
     st.header("📊 Multi-Modal Data Processing")
     
     if not st.session_state.initialized:
@@ -418,6 +410,12 @@ elif page == "📊 Data Processing":
             
             if data.modality.value == "structured":
                 df = pd.DataFrame(data.processed_content['data'])
+                
+                # Downcast numeric columns to shrink the Arrow payload sent to the browser
+                for col in df.select_dtypes(include='float').columns:
+                    df[col] = pd.to_numeric(df[col], downcast='float')
+                for col in df.select_dtypes(include='integer').columns:
+                    df[col] = pd.to_numeric(df[col], downcast='integer')
                 st.dataframe(df, use_container_width=True)
                 
                 # Summary stats
@@ -445,7 +443,8 @@ elif page == "📊 Data Processing":
         else:
             st.info("No data processed yet. Upload or generate data first.")
 
-elif page == "🔍 Insights":
+def render_insights():
+    """Render the insights page"""
     st.header("🔍 Intelligent Insights")
     
     if not st.session_state.initialized:
@@ -456,6 +455,11 @@ elif page == "🔍 Insights":
         st.warning("Please process some data first in the Data Processing section!")
         st.stop()
     
+    # Bind session state once for the render loop
+    state = st.session_state
+    role_id = state.selected_role
+    feedback_collector = state.feedback_collector
+    
     col1, col2 = st.columns([3, 1])
     
     with col1:
@@ -464,25 +468,30 @@ elif page == "🔍 Insights":
     with col2:
         if st.button("🔮 Generate Insights", use_container_width=True):
             with st.spinner("Analyzing data..."):
-                role_context = st.session_state.context_analyzer.create_role_context(
-                    st.session_state.selected_role
-                )
-                insight_req = st.session_state.context_analyzer.get_insight_requirements(
-                    st.session_state.selected_role
-                )
+                role_context = get_cached_role_context(state.context_analyzer, role_id)
+                insight_req = get_cached_insight_requirements(state.context_analyzer, role_id)
                 
-                insights = st.session_state.insight_generator.generate_insights(
-                    st.session_state.processed_data,
+                insights = state.insight_generator.generate_insights(
+                    state.processed_data,
                     role_context,
                     insight_req
                 )
                 
-                st.session_state.insights = insights
+                state.insights = insights
+                state.insight_type_options = tuple(sorted(
+                    {i.insight_type.value for i in insights.insights}
+                ))
+                state.insight_severity_options = tuple(sorted(
+                    {i.severity.value for i in insights.insights}
+                ))
+                
+                # New options: let the filters fall back to their defaults
+                state.pop("type_filter", None)
+                state.pop("sev_filter", None)
                 st.success(f"✅ Generated {insights.total_count} insights!")
     
-    if st.session_state.insights:
-        insights = st.session_state.insights
-        
+    insights = state.insights
+    if insights:
         # Metrics
         st.markdown("### 📊 Overview")
         col1, col2, col3, col4 = st.columns(4)
@@ -498,21 +507,25 @@ elif page == "🔍 Insights":
         with col1:
             filter_type = st.multiselect(
                 "Insight Type",
-                options=list(set([i.insight_type.value for i in insights.insights])),
-                default=list(set([i.insight_type.value for i in insights.insights]))
+                options=state.insight_type_options,
+                default=state.insight_type_options,
+                key="type_filter"
             )
         
         with col2:
             filter_severity = st.multiselect(
                 "Severity",
-                options=list(set([i.severity.value for i in insights.insights])),
-                default=list(set([i.severity.value for i in insights.insights]))
+                options=state.insight_severity_options,
+                default=state.insight_severity_options,
+                key="sev_filter"
             )
         
         with col3:
             min_confidence = st.slider("Min Confidence", 0.0, 1.0, 0.0, 0.1)
         
         # Filter insights
+        filter_type = set(filter_type)
+        filter_severity = set(filter_severity)
         filtered_insights = [
             i for i in insights.insights
             if i.insight_type.value in filter_type
@@ -524,11 +537,37 @@ elif page == "🔍 Insights":
         
         # Display insights
         for idx, insight in enumerate(filtered_insights, 1):
-            display_insight_card(insight, idx)
+            display_insight_card(insight, idx, feedback_collector, role_id)
     else:
         st.info("Click 'Generate Insights' to analyze your data!")
 
-elif page == "💬 Chat":
+def send_chat_message(prompt, chat_container):
+    """Process a chat message and render the new turn inline (no rerun needed)"""
+    state = st.session_state
+    chat_history = state.chat_history
+    
+    # Add user message
+    chat_history.append({"role": "user", "content": prompt})
+    with chat_container:
+        st.chat_message("user").write(prompt)
+    
+    with st.spinner("Thinking..."):
+        response = state.conversation_manager.process_message(
+            state.session_id,
+            prompt,
+            state.insights
+        )
+    
+    # Add assistant response
+    chat_history.append({
+        "role": "assistant",
+        "content": response.response_text
+    })
+    with chat_container:
+        st.chat_message("assistant").write(response.response_text)
+
+def render_chat():
+    """Render the chat page"""
     st.header("💬 Conversational Interface")
     
     if not st.session_state.initialized:
@@ -539,8 +578,15 @@ elif page == "💬 Chat":
     chat_container = st.container()
     
     with chat_container:
-        # Display chat history
-        for message in st.session_state.chat_history:
+        # Display only the tail of the chat history
+        chat_history = st.session_state.chat_history
+        hidden_count = len(chat_history) - st.session_state.chat_visible_count
+        
+        if hidden_count > 0 and st.button(f"⬆️ Load earlier messages ({hidden_count})"):
+            st.session_state.chat_visible_count += CHAT_PAGE_SIZE
+            hidden_count -= CHAT_PAGE_SIZE
+        
+        for message in islice(chat_history, max(hidden_count, 0), None):
             if message['role'] == 'user':
                 st.chat_message("user").write(message['content'])
             else:
@@ -548,24 +594,7 @@ elif page == "💬 Chat":
     
     # Chat input
     if prompt := st.chat_input("Ask me about your data..."):
-        # Add user message
-        st.session_state.chat_history.append({"role": "user", "content": prompt})
-        
-        with st.spinner("Thinking..."):
-            response = st.session_state.conversation_manager.process_message(
-                st.session_state.session_id,
-                prompt,
-                st.session_state.insights
-            )
-        
-        # Add assistant response
-        st.session_state.chat_history.append({
-            "role": "assistant",
-            "content": response.response_text
-        })
-        
-        # Rerun to display new messages
-        st.rerun()
+        send_chat_message(prompt, chat_container)
     
     # Suggested questions
     if st.session_state.insights:
@@ -582,23 +611,10 @@ elif page == "💬 Chat":
         for idx, suggestion in enumerate(suggestions):
             if cols[idx].button(suggestion, key=f"sugg_{idx}"):
                 # Trigger chat with suggestion
-                st.session_state.chat_history.append({"role": "user", "content": suggestion})
-                
-                with st.spinner("Thinking..."):
-                    response = st.session_state.conversation_manager.process_message(
-                        st.session_state.session_id,
-                        suggestion,
-                        st.session_state.insights
-                    )
-                
-                st.session_state.chat_history.append({
-                    "role": "assistant",
-                    "content": response.response_text
-                })
-                
-                st.rerun()
+                send_chat_message(suggestion, chat_container)
 
-elif page == "📈 Learning":
+def render_learning():
+    """Render the feedback and learning page"""
     st.header("📈 Feedback & Learning")
     
     if not st.session_state.initialized:
@@ -625,7 +641,12 @@ elif page == "📈 Learning":
     with tab2:
         st.subheader("Feedback Summary")
         
-        summary = st.session_state.feedback_collector.get_feedback_summary(days=30)
+        feedback_collector = st.session_state.feedback_collector
+        summary = get_cached_feedback_summary(
+            feedback_collector,
+            30,
+            count_feedback(feedback_collector)
+        )
         
         col1, col2, col3, col4 = st.columns(4)
         col1.metric("Total Feedback", summary.total_feedback)
@@ -633,9 +654,14 @@ elif page == "📈 Learning":
         col3.metric("Positive Rate", f"{summary.positive_rate:.1%}")
         col4.metric("Negative Rate", f"{summary.negative_rate:.1%}")
         
-        # Feedback over time (placeholder chart)
+        # Feedback over time
         if summary.total_feedback > 0:
-            st.line_chart([summary.avg_rating] * 7)
+            timeseries = get_cached_rating_timeseries(
+                feedback_collector,
+                30,
+                count_feedback(feedback_collector)
+            )
+            st.line_chart(timeseries, use_container_width=True)
     
     with tab3:
         st.subheader("System Adaptation")
@@ -654,7 +680,8 @@ elif page == "📈 Learning":
             for action in st.session_state.learning_engine.adaptation_history[-5:]:
                 st.success(f"✓ {action.action_type}: {action.expected_impact}")
 
-else:  # Settings
+def render_settings():
+    """Render the settings page"""
     st.header("⚙️ System Settings")
     
     st.subheader("Configuration")
@@ -696,6 +723,18 @@ else:  # Settings
             del st.session_state[key]
         st.rerun()
 
+PAGE_RENDERERS = {
+    "🏠 Home": render_home,
+    "📊 Data Processing": render_data_processing,
+    "🔍 Insights": render_insights,
+    "💬 Chat": render_chat,
+    "📈 Learning": render_learning,
+    "⚙️ Settings": render_settings
+}
+
+# Main content
+PAGE_RENDERERS[page]()
+
 # Footer
 st.markdown("---")
 st.markdown("""
@@ -8,11 +8,10 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from src.modules.input_processing.processor import InputProcessor
+from src.modules.singletons import get_input_processor
 from src.utils.sample_data_generator import SampleDataGenerator
 from src.utils.logger import app_logger as logger
 from src.config.settings import settings
-import json
 
 def print_section(title):
     """Print a section header"""
@@ -36,7 +35,7 @@ def test_module1():
     
     # Step 2: Initialize Input Processor
     print_section("Step 2: Initializing Input Processor")
-    processor = InputProcessor()
+    processor = get_input_processor()
     print("✓ Input Processor initialized successfully")
     
     # Show supported formats
@@ -90,6 +89,7 @@ def test_module1():
                 print(f"\nTop 5 entities:")
                 for entity in report_result.metadata.entities[:5]:
                     print(f"  - {entity.text} ({entity.label})")
+                print(f"  Entities by label: {report_result.metadata.entity_array.label_counts()}")
             
             if report_result.metadata.sentiment:
                 print(f"\nSentiment:")
@@ -9,9 +9,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.absolute()
 sys.path.insert(0, str(project_root))
 
-from src.modules.role_context.context_analyzer import RoleContextAnalyzer
-from src.modules.role_context.role_repository import RoleRepository
-from src.modules.input_processing.processor import InputProcessor
+from src.modules.singletons import get_input_processor, get_context_analyzer, get_role_repository
 from src.utils.sample_data_generator import SampleDataGenerator
 from src.utils.logger import app_logger as logger
 from src.config.settings import settings
@@ -30,9 +28,9 @@ def test_module2():
     # Step 1: Initialize components
     print_section("Step 1: Initializing Components")
     
-    role_repo = RoleRepository()
-    context_analyzer = RoleContextAnalyzer()
-    input_processor = InputProcessor()
+    role_repo = get_role_repository()
+    context_analyzer = get_context_analyzer()
+    input_processor = get_input_processor()
     
     print(f"✓ RoleRepository initialized with {len(role_repo.roles)} roles")
     print(f"✓ RoleContextAnalyzer initialized")
@@ -2,16 +2,16 @@
 Test script for Module 3 - Insight Generation & Explanation Engine
 Run this to validate the module is working correctly
 """
+import os
 import sys
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path
 project_root = Path(__file__).parent.absolute()
 sys.path.insert(0, str(project_root))
 
-from src.modules.input_processing.processor import InputProcessor
-from src.modules.role_context.context_analyzer import RoleContextAnalyzer
-from src.modules.insight_generation.generator import InsightGenerator
+from src.modules.singletons import get_input_processor, get_context_analyzer, get_insight_generator
 from src.modules.insight_generation.models import InsightGenerationConfig
 from src.utils.sample_data_generator import SampleDataGenerator
 from src.utils.logger import app_logger as logger
@@ -22,36 +22,56 @@ def print_section(title):
     print(f"  {title}")
     print("="*80 + "\n")
 
+# Detailed insight dumps are skipped with VERBOSE=0 (e.g. CI runs piping to /dev/null)
+VERBOSE = os.environ.get("VERBOSE", "1") != "0"
+
+INSIGHT_TEMPLATE = (
+    "Title: {title}\n"
+    "Severity: {severity}\n"
+    "Confidence: {confidence:.2%}\n"
+    "Relevance: {relevance:.2%}\n"
+    "Impact: {impact:.2%}\n"
+    "\nDescription: {description}\n"
+    "\nNarrative: {narrative}"
+)
+
 def print_insight(insight, index=None):
     """Pretty print an insight"""
+    if not VERBOSE:
+        return
+    
+    # Build the whole block and write it once
     if index:
-        print(f"\n--- Insight #{index}: {insight.insight_type.value.upper()} ---")
+        lines = [f"\n--- Insight #{index}: {insight.insight_type.value.upper()} ---"]
     else:
-        print(f"\n--- {insight.insight_type.value.upper()} Insight ---")
-    
-    print(f"Title: {insight.title}")
-    print(f"Severity: {insight.severity.value.upper()}")
-    print(f"Confidence: {insight.confidence_score:.2%}")
-    print(f"Relevance: {insight.relevance_score:.2%}")
-    print(f"Impact: {insight.impact_score:.2%}")
-    print(f"\nDescription: {insight.description}")
-    print(f"\nNarrative: {insight.narrative}")
+        lines = [f"\n--- {insight.insight_type.value.upper()} Insight ---"]
+    
+    lines.append(INSIGHT_TEMPLATE.format_map({
+        'title': insight.title,
+        'severity': insight.severity.value.upper(),
+        'confidence': insight.confidence_score,
+        'relevance': insight.relevance_score,
+        'impact': insight.impact_score,
+        'description': insight.description,
+        'narrative': insight.narrative
+    }))
     
     if insight.recommendations:
-        print(f"\nRecommendations:")
-        for rec in insight.recommendations:
-            print(f"  • {rec}")
+        lines.append("\nRecommendations:")
+        lines.extend(f"  • {rec}" for rec in insight.recommendations)
     
-    print(f"\nData Provenance:")
+    lines.append("\nData Provenance:")
     for prov in insight.data_provenance:
-        print(f"  Source: {prov.source_path}")
-        print(f"  Data points: {prov.data_points_used}")
-        print(f"  Quality: {prov.quality_score:.2%}")
+        lines.append(f"  Source: {prov.source_path}")
+        lines.append(f"  Data points: {prov.data_points_used}")
+        lines.append(f"  Quality: {prov.quality_score:.2%}")
     
-    print(f"\nExplanations:")
+    lines.append("\nExplanations:")
     for exp in insight.explanations:
-        print(f"  [{exp.component_type}] {exp.content}")
-        print(f"  Confidence: {exp.confidence:.2%}")
+        lines.append(f"  [{exp.component_type}] {exp.content}")
+        lines.append(f"  Confidence: {exp.confidence:.2%}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def test_module3():
     """Test Module 3 - Insight Generation & Explanation Engine"""
@@ -61,9 +81,9 @@ def test_module3():
     # Step 1: Initialize components
     print_section("Step 1: Initializing Components")
     
-    input_processor = InputProcessor()
-    context_analyzer = RoleContextAnalyzer()
-    insight_generator = InsightGenerator()
+    input_processor = get_input_processor()
+    context_analyzer = get_context_analyzer()
+    insight_generator = get_insight_generator()
     generator = SampleDataGenerator()
     
     print("✓ InputProcessor initialized")
@@ -113,27 +133,34 @@ def test_module3():
     
     roles_to_test = ["cfo", "regional_sales_manager", "financial_analyst"]
     
-    for role_id in roles_to_test:
+    # Generate insights for all roles concurrently (sales_data is only read)
+    with ThreadPoolExecutor(max_workers=len(roles_to_test)) as executor:
+        futures = {
+            role_id: executor.submit(
+                insight_generator.generate_insights,
+                sales_data,
+                context_analyzer.create_role_context(role_id),
+                context_analyzer.get_insight_requirements(role_id)
+            )
+            for role_id in roles_to_test
+        }
+    
+    for role_id, future in futures.items():
         print(f"\n--- Generating Insights for {role_id.replace('_', ' ').title()} ---")
         
-        # Create role context
-        role_context = context_analyzer.create_role_context(role_id)
-        insight_req = context_analyzer.get_insight_requirements(role_id)
-        
-        # Generate insights
-        role_insights = insight_generator.generate_insights(
-            sales_data,
-            role_context,
-            insight_req
-        )
+        role_insights = future.result()
         
-        print(f"Total insights: {role_insights.total_count}")
-        print(f"Avg confidence: {role_insights.avg_confidence:.2%}")
-        print(f"Critical: {role_insights.critical_insights} | High: {role_insights.high_priority_insights}")
+        lines = [
+            f"Total insights: {role_insights.total_count}",
+            f"Avg confidence: {role_insights.avg_confidence:.2%}",
+            f"Critical: {role_insights.critical_insights} | High: {role_insights.high_priority_insights}"
+        ]
         
         if role_insights.total_count > 0:
-            print(f"\nTop insight: {role_insights.insights[0].title}")
-            print(f"Type: {role_insights.insights[0].insight_type.value}")
+            lines.append(f"\nTop insight: {role_insights.insights[0].title}")
+            lines.append(f"Type: {role_insights.insights[0].insight_type.value}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     # Step 6: Test different insight types
     print_section("Step 6: Testing Different Insight Types")
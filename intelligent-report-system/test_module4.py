@@ -2,50 +2,66 @@
 Test script for Module 4 - Conversational Interface
 Run this to validate the module is working correctly
 """
+import asyncio
 import sys
+from itertools import chain, islice
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.absolute()
 sys.path.insert(0, str(project_root))
 
-from src.modules.input_processing.processor import InputProcessor
-from src.modules.role_context.context_analyzer import RoleContextAnalyzer
-from src.modules.insight_generation.generator import InsightGenerator
-from src.modules.conversational_interface.manager import ConversationManager
-from src.utils.sample_data_generator import SampleDataGenerator
-from src.utils.logger import app_logger as logger
+# Section header, built once and written with a single call
+BANNER = "\n" + "="*80 + "\n  {}\n" + "="*80 + "\n\n"
 
 def print_section(title):
     """Print a section header"""
-    print("\n" + "="*80)
-    print(f"  {title}")
-    print("="*80 + "\n")
+    sys.stdout.write(BANNER.format(title))
+
+def format_chat(query, response):
+    """Format one chat exchange for printing"""
+    lines = [
+        f"👤 User: {query}",
+        f"🤖 Assistant: {response.response_text}",
+        f"   [Intent: {response.intent.value} | Confidence: {response.confidence:.0%}]"
+    ]
+    if response.suggested_questions:
+        lines.append(f"   💡 Suggestions: {', '.join(response.suggested_questions[:2])}")
+    return "\n".join(lines) + "\n"
 
 def chat(manager, session_id, query, insights):
     """Simulate a chat interaction"""
-    print(f"👤 User: {query}")
     response = manager.process_message(session_id, query, insights)
-    print(f"🤖 Assistant: {response.response_text}")
-    print(f"   [Intent: {response.intent.value} | Confidence: {response.confidence:.0%}]")
-    if response.suggested_questions:
-        print(f"   💡 Suggestions: {', '.join(response.suggested_questions[:2])}")
-    print()
+    sys.stdout.write(format_chat(query, response) + "\n")
     return response
 
+async def chat_async(manager, session_id, query, insights):
+    """Run a chat interaction in a worker thread"""
+    return await asyncio.to_thread(manager.process_message, session_id, query, insights)
+
+async def run_independent_chats(manager, session_ids, queries, insights):
+    """Send independent queries (one per session) concurrently"""
+    return await asyncio.gather(*[
+        chat_async(manager, session_id, query, insights)
+        for session_id, query in zip(session_ids, queries)
+    ])
+
 def test_module4():
     """Test Module 4 - Conversational Interface"""
     
+    # Imported here so pandas/numpy/ollama load only when the test actually runs
+    from src.modules.singletons import get_input_processor, get_context_analyzer, get_insight_generator, get_sample_insights
+    from src.modules.conversational_interface.manager import ConversationManager
+    
     print_section("MODULE 4: CONVERSATIONAL INTERFACE - TEST SUITE")
     
     # Step 1: Initialize all components
     print_section("Step 1: Initializing Full System (Hybrid LLM + Pattern Matching)")
     
-    input_processor = InputProcessor()
-    context_analyzer = RoleContextAnalyzer()
-    insight_generator = InsightGenerator()
+    get_input_processor()
+    get_context_analyzer()
+    get_insight_generator()
     conversation_manager = ConversationManager(use_llm=True)  # Enable LLM
-    generator = SampleDataGenerator()
     
     print("✓ InputProcessor initialized")
     print("✓ RoleContextAnalyzer initialized")
@@ -54,6 +70,10 @@ def test_module4():
     if conversation_manager.use_llm:
         print("✓ ConversationManager initialized with LLM support (Ollama)")
         print(f"  Model: {conversation_manager.llm_handler.model_name}")
+        
+        # Load the model now so Step 4 doesn't pay the cold-start latency
+        if conversation_manager.llm_handler.warmup():
+            print("✓ Model warmed up and kept loaded")
     else:
         print("✓ ConversationManager initialized with pattern matching only")
         print("  Note: Install Ollama for LLM support (see OLLAMA_SETUP.md)")
@@ -62,11 +82,8 @@ def test_module4():
     print_section("Step 2: Generating Insights for Conversation")
     
     print("Processing sales data...")
-    sales_file = generator.generate_sales_data(num_rows=300)
-    sales_data = input_processor.process_file(sales_file)
-    
     print("Generating insights...")
-    insights = insight_generator.generate_insights(sales_data)
+    sales_data, insights = get_sample_insights(num_rows=300, seed=42)
     
     print(f"✓ Processed {sales_data.metadata.row_count} rows")
     print(f"✓ Generated {insights.total_count} insights")
@@ -82,23 +99,31 @@ def test_module4():
     # Step 4: Test different query types
     print_section("Step 4: Testing Conversational Queries")
     
-    print("--- Scenario 1: Getting Started ---")
-    chat(conversation_manager, session_id, "Hi, what do you have for me?", insights)
-    
-    print("--- Scenario 2: Summary Request ---")
-    chat(conversation_manager, session_id, "Give me a summary of the key insights", insights)
-    
-    print("--- Scenario 3: Clarification Question ---")
-    chat(conversation_manager, session_id, "Why is quantity increasing?", insights)
-    
-    print("--- Scenario 4: Drill Down ---")
-    chat(conversation_manager, session_id, "Tell me more details about the trends", insights)
-    
-    print("--- Scenario 5: Comparison ---")
-    chat(conversation_manager, session_id, "Compare the performance across regions", insights)
+    scenarios = [
+        ("Scenario 1: Getting Started", "Hi, what do you have for me?"),
+        ("Scenario 2: Summary Request", "Give me a summary of the key insights"),
+        ("Scenario 3: Clarification Question", "Why is quantity increasing?"),
+        ("Scenario 4: Drill Down", "Tell me more details about the trends"),
+        ("Scenario 5: Comparison", "Compare the performance across regions"),
+        ("Scenario 6: Recommendations", "What should I do about these findings?")
+    ]
     
-    print("--- Scenario 6: Recommendations ---")
-    chat(conversation_manager, session_id, "What should I do about these findings?", insights)
+    # Scenarios are independent, so each gets its own session and they run concurrently
+    scenario_sessions = [session_id] + [
+        conversation_manager.create_session(user_role="cfo") for _ in scenarios[1:]
+    ]
+    responses = asyncio.run(run_independent_chats(
+        conversation_manager,
+        scenario_sessions,
+        [query for _, query in scenarios],
+        insights
+    ))
+    
+    # Write in scenario order once all have completed, as one block
+    sys.stdout.write("".join(
+        f"--- {title} ---\n{format_chat(query, response)}\n"
+        for (title, query), response in zip(scenarios, responses)
+    ))
     
     # Step 5: Test intent classification
     print_section("Step 5: Intent Classification Testing")
@@ -113,11 +138,11 @@ def test_module4():
         "Show me a bar chart"
     ]
     
-    processor = conversation_manager.query_processor
+    # One batched classification call (single LLM prompt when available)
+    classifications = conversation_manager.classify_intents(test_queries)
     
     print("Intent Classification Results:\n")
-    for query in test_queries:
-        classification = processor.classify_intent(query)
+    for query, classification in zip(test_queries, classifications):
         print(f"Query: '{query}'")
         print(f"  Intent: {classification.intent.value}")
         print(f"  Confidence: {classification.confidence:.0%}")
@@ -128,10 +153,14 @@ def test_module4():
     # Step 6: Test conversation history
     print_section("Step 6: Conversation History")
     
-    history = conversation_manager.get_conversation_history(session_id)
-    print(f"Conversation turns: {len(history)}\n")
+    # Count turns without building them; only the 3 printed turns are materialized
+    total_turns = sum(conversation_manager.get_turn_count(session) for session in scenario_sessions)
+    print(f"Conversation turns: {total_turns}\n")
     
-    for i, turn in enumerate(history[:3], 1):
+    history = chain.from_iterable(
+        conversation_manager.get_conversation_history(session, limit=3) for session in scenario_sessions
+    )
+    for i, turn in enumerate(islice(history, 3), 1):
         print(f"Turn {i}:")
         print(f"  User: {turn['user'][:60]}...")
         print(f"  Intent: {turn['intent']}")
@@ -152,8 +181,11 @@ def test_module4():
         "What should I investigate further?"
     ]
     
-    for query in conversation_flow:
-        chat(conversation_manager, new_session, query, insights)
+    # Stream the turns through one session; each exchange is printed as soon as it is answered
+    for query, response in conversation_manager.process_messages_stream(
+        new_session, conversation_flow, insights
+    ):
+        sys.stdout.write(format_chat(query, response) + "\n")
     
     # Step 8: Test without insights
     print_section("Step 8: Handling Edge Cases")
@@ -189,7 +221,7 @@ def test_module4():
     
     print("\nConversation Statistics:")
     print(f"  Total sessions: {len(conversation_manager.active_sessions)}")
-    print(f"  Queries processed: {len(history) + len(conversation_flow)}")
+    print(f"  Queries processed: {total_turns + len(conversation_flow)}")
     print(f"  Intents supported: 9")
     
     print("\nNext Steps:")
@@ -203,6 +235,7 @@ if __name__ == "__main__":
     try:
         test_module4()
     except Exception as e:
+        from src.utils.logger import app_logger as logger
         logger.error(f"Test failed with error: {str(e)}")
         print(f"\n✗ TEST FAILED: {str(e)}")
         import traceback
@@ -1,6 +1,7 @@
 """
 Quick test to verify Ollama installation and connectivity
 """
+import re
 import sys
 
 def test_ollama():
@@ -56,13 +57,34 @@ def test_ollama():
         model_name = models[0]['name'].split(':')[0]
         print(f"  Using model: {model_name}")
         
-        response = ollama.generate(
+        # Batch several sanity prompts into one chat call: one round trip and one prefill
+        prompts = ["Say hello.", "Say hi.", "Say hey.", "Say howdy."]
+        numbered = "\n".join(f"[{i}] {prompt}" for i, prompt in enumerate(prompts, 1))
+        
+        client = ollama.Client(timeout=60)
+        response = client.chat(
             model=model_name,
-            prompt="Say hello in one sentence.",
-            options={'num_predict': 50}
+            messages=[
+                {
+                    'role': 'system',
+                    'content': "Answer each numbered request in one short sentence, "
+                               "one line per answer, prefixed with its [number]."
+                },
+                {'role': 'user', 'content': numbered}
+            ],
+            options={'num_predict': 50, 'num_batch': 128}
         )
         
-        print(f"✓ Model response: {response['response'][:100]}")
+        # Split the delimited reply back into per-prompt answers
+        content = response['message']['content']
+        answers = dict(re.findall(r'\[(\d+)\]\s*(.+)', content))
+        
+        if answers:
+            print(f"✓ Model answered {len(answers)}/{len(prompts)} batched prompts:")
+            for number, answer in sorted(answers.items()):
+                print(f"  [{number}] {answer.strip()[:100]}")
+        else:
+            print(f"✓ Model response: {content[:100]}")
     except Exception as e:
         print(f"✗ Error testing generation: {str(e)}")
         return False